@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Regenerate usage_guide.txt, the prebuilt copy of the usage guide
+Run this after changing any text in usage_guide.py
+"""
+
+import usage_guide
+
+
+def main():
+    usage_guide.GUIDE_PATH.write_bytes(usage_guide.GUIDE_BYTES)
+    print(f"✅ Wrote {usage_guide.GUIDE_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,11 @@ FastAPI REST API for AI Research Assistant
 
 from src.config import Config
 from src.research_assistant import ResearchAssistant
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import tempfile
+import io
 import sys
 from pathlib import Path
 import logging
@@ -84,7 +84,6 @@ async def root():
 
 @app.post("/papers/upload")
 async def upload_paper(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     paper_id: Optional[str] = None
 ):
@@ -95,18 +94,9 @@ async def upload_paper(
             status_code=400, detail="Only PDF files are supported")
 
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
-
-        # Process the paper
-        result_paper_id = assistant.upload_paper(tmp_file_path, paper_id)
-
-        # Clean up temp file in background
-        background_tasks.add_task(lambda: Path(
-            tmp_file_path).unlink(missing_ok=True))
+        # Process the paper straight from memory
+        content = await file.read()
+        result_paper_id = assistant.upload_paper(io.BytesIO(content), paper_id)
 
         return {
             "message": "Paper uploaded successfully",
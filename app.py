@@ -7,11 +7,16 @@ import streamlit as st
 import logging
 import sys
 from pathlib import Path
+import io
 import json
-import tempfile
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster JSON exports
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
@@ -20,6 +25,28 @@ sys.path.append(str(Path(__file__).parent / "src"))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _export_default(value: Any) -> Any:
+    """Convert numpy values to plain numbers and lists, anything else to str."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def dumps_export(data: Any) -> str:
+    """Serialize export data as indented JSON, stringifying unsupported values."""
+    if orjson is not None:
+        # Pass dataclasses and datetimes to the default like the json fallback does
+        return orjson.dumps(
+            data,
+            default=_export_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode("utf-8")
+
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_export_default)
+
 # Page configuration
 st.set_page_config(
     page_title="🔬 AI Research Assistant",
@@ -317,7 +344,6 @@ def validate_uploaded_file(uploaded_file) -> dict:
 
 def process_uploaded_paper(uploaded_file, extract_figures: bool, auto_analyze: bool):
     """Process an uploaded paper with comprehensive error handling."""
-    tmp_path = None
     try:
         # Initialize assistant if needed
         assistant = get_assistant()
@@ -328,19 +354,14 @@ def process_uploaded_paper(uploaded_file, extract_figures: bool, auto_analyze: b
         # Create progress bar
         progress_bar = st.progress(0, text="Starting processing...")
         
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-        
-        progress_bar.progress(20, text="File saved, starting analysis...")
+        progress_bar.progress(20, text="File received, starting analysis...")
 
         # Process paper with detailed progress
         with st.spinner(f"🔄 Processing {uploaded_file.name}..."):
             progress_bar.progress(40, text="Extracting text and structure...")
             
             # Upload and process paper
-            paper_id = assistant.upload_paper(tmp_path)
+            paper_id = assistant.upload_paper(io.BytesIO(uploaded_file.getvalue()))
             progress_bar.progress(60, text="Generating embeddings...")
 
             # Get paper info
@@ -386,14 +407,6 @@ def process_uploaded_paper(uploaded_file, extract_figures: bool, auto_analyze: b
             st.write("- Ensure the PDF is not corrupted")
             st.write("- Try a smaller file size")
             st.write("- Check if the PDF contains extractable text")
-    
-    finally:
-        # Always clean up temporary file
-        if tmp_path and Path(tmp_path).exists():
-            try:
-                Path(tmp_path).unlink()
-            except Exception as cleanup_error:
-                logger.warning(f"Could not clean up temp file {tmp_path}: {cleanup_error}")
 
 
 def ask_questions_page():
@@ -666,7 +679,7 @@ def export_all_history():
             "app_version": "AI Research Assistant v1.0"
         }
         
-        json_data = json.dumps(export_data, indent=2, ensure_ascii=False, default=str)
+        json_data = dumps_export(export_data)
         
         st.download_button(
             label="📥 Download Complete History",
@@ -734,7 +747,7 @@ def settings_page():
     
     # Get counts safely
     if st.session_state.assistant_initialized and st.session_state.assistant:
-        papers_count = len(st.session_state.assistant.list_papers())
+        papers_count = st.session_state.assistant.count_papers()
     else:
         papers_count = 0
     qa_count = len(st.session_state.get('qa_history', []))
@@ -906,7 +919,7 @@ def export_complete_workspace():
             "app_version": "AI Research Assistant v1.0"
         }
         
-        json_data = json.dumps(workspace_data, indent=2, ensure_ascii=False, default=str)
+        json_data = dumps_export(workspace_data)
         
         st.download_button(
             label="📥 Download Complete Workspace",
@@ -988,11 +1001,7 @@ def delete_paper(paper_id: str):
         
         # Remove from assistant if it exists
         if assistant:
-            if paper_id in assistant.papers:
-                del assistant.papers[paper_id]
-            
-            if paper_id in assistant.paper_embeddings:
-                del assistant.paper_embeddings[paper_id]
+            assistant.delete_paper(paper_id)
         
         # Remove from session state
         if paper_id in st.session_state.papers:
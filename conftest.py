@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the AI Research Assistant test scripts
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path once for all test modules
+_SRC_PATH = str(Path(__file__).parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.append(_SRC_PATH)
@@ -36,6 +36,10 @@ class ModelConfig:
     max_length: int = 512
     batch_size: int = 16
     embedding_dim: int = 768
+    # INT8 dynamic quantization of the QA model on CPU: faster, but answers and
+    # confidences can shift slightly, so it is opt-in
+    quantize_cpu: bool = False
+    qa_cpu_dtype: str = "float32"  # QA model precision on CPU: float32, bfloat16
 
 
 @dataclass
@@ -141,6 +145,8 @@ class ResearchConfig:
     # Question answering
     qa_confidence_threshold: float = 0.5
     max_context_length: int = 2000
+    qa_doc_stride: int = 128  # Token overlap between QA windows
+    qa_max_windows: int = 4  # Model windows a QA context may span
 
     # Analysis features
     contribution_analysis: bool = True
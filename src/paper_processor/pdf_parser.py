@@ -7,7 +7,7 @@ import re
 import fitz  # PyMuPDF
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, IO, Union
 from dataclasses import dataclass
 from PIL import Image
 import io
@@ -94,12 +94,18 @@ class AcademicPDFParser:
 
         return patterns
 
-    def parse_paper(self, pdf_path: str) -> ParsedPaper:
-        """Parse an academic paper PDF."""
+    def parse_paper(self, pdf_path: Union[str, IO[bytes]]) -> ParsedPaper:
+        """Parse an academic paper PDF from a path or a binary file-like object."""
         logger.info(f"Parsing academic paper: {pdf_path}")
 
         try:
-            doc = fitz.open(pdf_path)
+            if hasattr(pdf_path, 'read'):
+                # Parse in memory; figures go to the temp directory
+                doc = fitz.open(stream=pdf_path.read(), filetype="pdf")
+                figures_dir = Path(self.config.processing.temp_dir) / "figures"
+            else:
+                doc = fitz.open(pdf_path)
+                figures_dir = Path(pdf_path).parent / "figures"
 
             # Extract metadata
             metadata = self._extract_metadata(doc)
@@ -111,7 +117,7 @@ class AcademicPDFParser:
             sections = self._extract_sections(doc, full_text)
 
             # Extract figures
-            figures = self._extract_figures(doc, pdf_path)
+            figures = self._extract_figures(doc, figures_dir)
 
             # Extract tables
             tables = self._extract_tables(doc)
@@ -364,11 +370,10 @@ class AcademicPDFParser:
 
         return sections
 
-    def _extract_figures(self, doc: fitz.Document, pdf_path: str) -> List[PaperFigure]:
-        """Extract figures from the paper."""
+    def _extract_figures(self, doc: fitz.Document, base_path: Path) -> List[PaperFigure]:
+        """Extract figures from the paper into base_path."""
         figures = []
-        base_path = Path(pdf_path).parent / "figures"
-        base_path.mkdir(exist_ok=True)
+        base_path.mkdir(parents=True, exist_ok=True)
 
         for page_num, page in enumerate(doc):
             # Get images from page
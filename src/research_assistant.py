@@ -4,7 +4,7 @@ Main Research Assistant class that coordinates all components.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, IO, Union
 import json
 import uuid
 from datetime import datetime
@@ -27,23 +27,26 @@ class ResearchAssistant:
         # Initialize components
         self.pdf_parser = AcademicPDFParser(self.config)
         self.embeddings = MultimodalResearchEmbeddings(self.config)
-        self.qa_system = AcademicQuestionAnswering(self.config)
+        self.qa_system = AcademicQuestionAnswering(self.config, embeddings=self.embeddings)
 
         # Paper storage
         self.papers: Dict[str, ParsedPaper] = {}
         self.paper_embeddings: Dict[str, Dict[str, Any]] = {}
 
+        # Normalized abstract embeddings used for retrieval, per paper
+        self._abstract_vectors: Dict[str, Any] = {}
+
         # Load existing papers if available
         self._load_existing_papers()
 
         logger.info("Research Assistant initialized successfully")
 
-    def upload_paper(self, file_path: str, paper_id: Optional[str] = None) -> str:
+    def upload_paper(self, file_path: Union[str, IO[bytes]], paper_id: Optional[str] = None) -> str:
         """
         Upload and process a research paper.
 
         Args:
-            file_path: Path to the PDF file
+            file_path: Path to the PDF file, or a binary file-like object with its contents
             paper_id: Optional custom ID for the paper
 
         Returns:
@@ -64,6 +67,11 @@ class ResearchAssistant:
             # Store paper and embeddings
             self.papers[paper_id] = parsed_paper
             self.paper_embeddings[paper_id] = embeddings
+            self._abstract_vectors[paper_id] = self._abstract_vector(embeddings)
+
+            # Questions rank sections with the same embeddings
+            if 'sections' in embeddings:
+                self.qa_system.set_section_vectors(parsed_paper.sections, embeddings['sections'])
 
             # Save to disk
             self._save_paper_data(paper_id, parsed_paper, embeddings)
@@ -75,6 +83,20 @@ class ResearchAssistant:
             logger.error(f"Error processing paper {file_path}: {e}")
             raise
 
+    def delete_paper(self, paper_id: str) -> bool:
+        """
+        Remove a paper and its embeddings from memory.
+
+        Args:
+            paper_id: ID of the paper to remove
+
+        Returns:
+            True if the paper was found and removed
+        """
+        self.paper_embeddings.pop(paper_id, None)
+        self._abstract_vectors.pop(paper_id, None)
+        return self.papers.pop(paper_id, None) is not None
+
     def ask_question(self,
                      question: str,
                      paper_id: Optional[str] = None,
@@ -107,6 +129,26 @@ class ResearchAssistant:
             # Search across all papers
             return self._answer_multi_paper_question(question)
 
+    def ask_questions(self, questions: List[str], paper_id: Optional[str] = None) -> List[ResearchAnswer]:
+        """
+        Ask several questions about a research paper at once.
+
+        Args:
+            questions: The research questions
+            paper_id: ID of the paper to query (if None, search all papers)
+
+        Returns:
+            Answers in the same order as the questions
+        """
+        if paper_id and paper_id not in self.papers:
+            raise ValueError(f"Paper {paper_id} not found")
+
+        if paper_id:
+            # Batch the questions through the QA model together
+            return self.qa_system.answer_questions(questions, self.papers[paper_id])
+        else:
+            return [self._answer_multi_paper_question(question) for question in questions]
+
     def summarize_paper(self, paper_id: str, section: Optional[str] = None) -> str:
         """
         Generate a summary of a paper or specific section.
@@ -167,12 +209,11 @@ class ResearchAssistant:
         paper = self.papers[paper_id]
 
         # Ask contribution-related questions
-        contribution_answer = self.qa_system.answer_question(
-            "What are the main contributions?", paper)
-        novelty_answer = self.qa_system.answer_question(
-            "What is novel about this work?", paper)
-        significance_answer = self.qa_system.answer_question(
-            "What is the significance of this research?", paper)
+        contribution_answer, novelty_answer, significance_answer = self.qa_system.answer_questions([
+            "What are the main contributions?",
+            "What is novel about this work?",
+            "What is the significance of this research?",
+        ], paper)
 
         return {
             "main_contributions": contribution_answer.answer,
@@ -201,12 +242,11 @@ class ResearchAssistant:
         paper = self.papers[paper_id]
 
         # Ask methodology-related questions
-        method_answer = self.qa_system.answer_question(
-            "What is the methodology?", paper)
-        approach_answer = self.qa_system.answer_question(
-            "What approach was used?", paper)
-        dataset_answer = self.qa_system.answer_question(
-            "What datasets were used?", paper)
+        method_answer, approach_answer, dataset_answer = self.qa_system.answer_questions([
+            "What is the methodology?",
+            "What approach was used?",
+            "What datasets were used?",
+        ], paper)
 
         return {
             "methodology": method_answer.answer,
@@ -316,6 +356,15 @@ class ResearchAssistant:
 
         return papers_list
 
+    def count_papers(self) -> int:
+        """
+        Count uploaded papers without building their listing.
+
+        Returns:
+            Number of papers
+        """
+        return len(self.papers)
+
     def search_papers(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
         Search papers by content similarity.
@@ -330,18 +379,19 @@ class ResearchAssistant:
         if not self.papers:
             return []
 
+        import numpy as np
+
         # Generate query embedding
-        query_embedding = self.embeddings.encode_research_question(query)
+        query_vector = self._unit_vector(self.embeddings.encode_research_question(query))
 
         # Calculate similarity with all papers
         similarities = []
 
-        for paper_id, embeddings in self.paper_embeddings.items():
+        for paper_id in self.paper_embeddings:
             # Use abstract embedding for similarity
-            if 'abstract' in embeddings:
-                abstract_embedding = embeddings['abstract']
-                similarity = self._calculate_similarity(
-                    query_embedding, abstract_embedding)
+            abstract_vector = self._abstract_vectors.get(paper_id)
+            if abstract_vector is not None:
+                similarity = float(np.dot(query_vector, abstract_vector))
                 similarities.append((paper_id, similarity))
 
         # Sort by similarity
@@ -414,23 +464,19 @@ class ResearchAssistant:
 
         return answer
 
-    def _calculate_similarity(self, emb1, emb2):
-        """Calculate cosine similarity between two embeddings."""
-        import numpy as np
-
-        # Ensure embeddings are 1D
-        emb1 = emb1.flatten() if emb1.ndim > 1 else emb1
-        emb2 = emb2.flatten() if emb2.ndim > 1 else emb2
+    def _abstract_vector(self, embeddings: Dict[str, Any]):
+        """Unit-length abstract embedding of a paper, or None if it has no abstract."""
+        if 'abstract' not in embeddings:
+            return None
+        return self._unit_vector(embeddings['abstract'])
 
-        # Calculate cosine similarity
-        dot_product = np.dot(emb1, emb2)
-        norm1 = np.linalg.norm(emb1)
-        norm2 = np.linalg.norm(emb2)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+    def _unit_vector(self, embedding):
+        """Flatten an embedding and scale it to unit length; zero vectors stay zero."""
+        import numpy as np
 
-        return dot_product / (norm1 * norm2)
+        vector = np.asarray(embedding, dtype=float).flatten()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
 
     def _generate_comparison_summary(self, comparisons: Dict, aspect: str) -> str:
         """Generate a summary of paper comparisons."""
@@ -2,6 +2,8 @@
 Research-specific embeddings for academic papers using scientific models.
 """
 
+import hashlib
+from collections import OrderedDict
 import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModel
@@ -22,6 +24,10 @@ class ScientificEmbeddings:
 
         logger.info(f"Using device: {self.device}")
 
+        # Recently encoded texts by content digest, most recently used last
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embedding_cache_size = 1024
+
         # Load scientific embeddings model
         self._load_model()
 
@@ -70,20 +76,40 @@ class ScientificEmbeddings:
             self.model_type = "sentence_transformer"
 
     def encode_text(self, texts: Union[str, List[str]], **kwargs) -> np.ndarray:
-        """Encode text using scientific embeddings."""
+        """Encode text using scientific embeddings, reusing recently encoded texts."""
         if isinstance(texts, str):
             texts = [texts]
+        if not texts:
+            return np.empty((0, self.get_dimension()), dtype=np.float32)
+
+        keys = [hashlib.sha256(text.encode('utf-8')).digest()[:16] for text in texts]
+        missing = list(dict.fromkeys(
+            (key, text) for key, text in zip(keys, texts) if key not in self._embedding_cache))
 
         try:
-            if self.model_type == "bert":
-                return self._encode_with_bert(texts, **kwargs)
-            else:
-                return self._encode_with_sentence_transformer(texts, **kwargs)
+            if missing:
+                missing_texts = [text for _, text in missing]
+                if self.model_type == "bert":
+                    encoded = self._encode_with_bert(missing_texts, **kwargs)
+                else:
+                    encoded = self._encode_with_sentence_transformer(missing_texts, **kwargs)
+
+                for (key, _), embedding in zip(missing, encoded):
+                    self._embedding_cache[key] = embedding.copy()
 
         except Exception as e:
             logger.error(f"Error encoding texts: {e}")
             raise
 
+        embeddings = np.vstack([self._embedding_cache[key] for key in keys])
+
+        for key in keys:
+            self._embedding_cache.move_to_end(key)
+        while len(self._embedding_cache) > self._embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+
+        return embeddings
+
     def _encode_with_bert(self, texts: List[str], **kwargs) -> np.ndarray:
         """Encode texts using BERT-style models."""
         embeddings = []
@@ -2,19 +2,387 @@
 Academic question answering system specialized for research papers.
 """
 
+import heapq
+import os
 import re
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, replace
 import logging
-from transformers import pipeline, AutoTokenizer, AutoModelForQuestionAnswering
-import torch
 
 from ..paper_processor.pdf_parser import ParsedPaper, PaperSection
-from ..research_embeddings.academic_embeddings import MultimodalResearchEmbeddings
+
+# torch, transformers and the embedding models are imported when first needed
+if TYPE_CHECKING:
+    from ..research_embeddings.academic_embeddings import MultimodalResearchEmbeddings
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common words ignored when matching question keywords
+_STOP_WORDS = frozenset({'the', 'is', 'at', 'which', 'on', 'and', 'a',
+                         'to', 'are', 'as', 'was', 'for', 'with', 'by'})
+
+# Generic questions answered with a summary of the paper
+_VERY_GENERIC = (
+    'what is this',
+    'what is that',
+    'what is it',
+    'describe this',
+    'tell me about this',
+    'what does this say',
+    'what is the content',
+    'what is in this',
+    'explain this',
+    'summarize this'
+)
+
+# Cosine similarity between a question and a section at or below which the
+# section is taken as unrelated; sentence embeddings of unrelated texts
+# still score around 0.1-0.2
+_UNRELATED_SIMILARITY = 0.25
+
+# Derived per-paper/per-section values, keyed by id() and dropped when the
+# owning object is garbage collected (parsed objects are left untouched).
+_object_caches: Dict[int, Dict[str, Any]] = {}
+# Caches are created from the CPU pool's threads as well as the caller's
+_object_caches_lock = threading.Lock()
+
+
+def _object_cache(obj: Any) -> Dict[str, Any]:
+    """Get the scratch cache attached to a parsed paper or section."""
+    key = id(obj)
+    cache = _object_caches.get(key)
+    if cache is None:
+        with _object_caches_lock:
+            cache = _object_caches.get(key)
+            if cache is None:
+                cache = _object_caches[key] = {}
+                weakref.finalize(obj, _object_caches.pop, key, None)
+    return cache
+
+
+@lru_cache(maxsize=None)
+def _cpu_pool() -> ThreadPoolExecutor:
+    """Thread pool preparing contexts for question batches, shared by all instances."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count(),
+                              thread_name_prefix="academic-qa")
+
+
+@lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Probe for CUDA once; the first probe initializes the driver."""
+    import torch
+
+    return torch.cuda.is_available()
+
+
+@lru_cache(maxsize=4)
+def _get_qa_pipeline(model_name: str, device: int, quantize_cpu: bool = False,
+                     cpu_dtype: str = "float32"):
+    """Load a question answering pipeline, shared by all instances using the same model and device.
+
+    On GPU the model is loaded in half precision, falling back to full
+    precision for models that cannot run in FP16, and compiled. On CPU it
+    is either loaded in BF16 or kept in FP32 with its linear layers
+    optionally quantized to INT8.
+    """
+    import torch
+    from transformers import pipeline
+
+    if device >= 0:
+        try:
+            qa_pipeline = pipeline(
+                "question-answering",
+                model=model_name,
+                tokenizer=model_name,
+                device=device,
+                model_kwargs={"torch_dtype": torch.float16}
+            )
+        except Exception as e:
+            logger.warning(f"FP16 QA model unavailable, using FP32: {e}")
+            qa_pipeline = pipeline(
+                "question-answering",
+                model=model_name,
+                tokenizer=model_name,
+                device=device
+            )
+        _compile_qa_model(qa_pipeline)
+        return qa_pipeline
+
+    if cpu_dtype == "bfloat16":
+        try:
+            return pipeline(
+                "question-answering",
+                model=model_name,
+                tokenizer=model_name,
+                device=device,
+                model_kwargs={"torch_dtype": torch.bfloat16}
+            )
+        except Exception as e:
+            logger.warning(f"BF16 QA model unavailable, using FP32: {e}")
+
+    qa_pipeline = pipeline(
+        "question-answering",
+        model=model_name,
+        tokenizer=model_name,
+        device=device
+    )
+    if quantize_cpu:
+        _quantize_qa_model(qa_pipeline)
+    return qa_pipeline
+
+
+def _qa_tokenizer_lock(qa_pipeline: Any) -> Any:
+    """Lock serializing calls into a shared pipeline's tokenizer.
+
+    Fast tokenizers must not be called from several threads at once, and a
+    pipeline's tokenizer is shared by every instance using it.
+    """
+    return _object_cache(qa_pipeline).setdefault('tokenizer_lock', threading.RLock())
+
+
+def _quantize_qa_model(qa_pipeline: Any) -> None:
+    """Dynamically quantize the pipeline's linear layers to INT8, keeping FP32 on failure.
+
+    Opt-in through ModelConfig.quantize_cpu: it trades a little answer
+    accuracy for speed, and torch.ao quantization is deprecated in recent
+    PyTorch releases.
+    """
+    import torch
+
+    try:
+        from torch.ao.quantization import quantize_dynamic
+
+        qa_pipeline.model = quantize_dynamic(
+            qa_pipeline.model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        logger.warning(f"QA model quantization failed, using FP32: {e}")
+
+
+def _compile_qa_model(qa_pipeline: Any) -> None:
+    """Compile the pipeline's model in place, keeping it eager if compilation fails.
+
+    Compilation happens on first use, so a warm-up question triggers it at
+    load time instead of on the first user question.
+    """
+    import torch
+
+    if not hasattr(torch, 'compile'):
+        return
+
+    eager_model = qa_pipeline.model
+    try:
+        # Context lengths vary per question, so compile for dynamic shapes
+        qa_pipeline.model = torch.compile(eager_model, dynamic=True)
+        with torch.inference_mode():
+            qa_pipeline(question="What is this paper about?",
+                        context="This paper studies question answering over research papers.")
+    except Exception as e:
+        logger.warning(f"QA model compilation failed, using eager mode: {e}")
+        qa_pipeline.model = eager_model
+
+
+def _paper_cache_key(paper: ParsedPaper) -> object:
+    """Identity token for a paper in cache keys; unlike id(), never reused."""
+    return _object_cache(paper).setdefault('cache_key', object())
+
+
+def _lower_title(section: PaperSection) -> str:
+    """Lowercased section title, computed once per section."""
+    cache = _object_cache(section)
+    if 'title_lower' not in cache:
+        cache['title_lower'] = section.title.lower()
+    return cache['title_lower']
+
+
+def _lower_content(section: PaperSection) -> str:
+    """Lowercased section content, computed once per section."""
+    cache = _object_cache(section)
+    if 'content_lower' not in cache:
+        cache['content_lower'] = section.content.lower()
+    return cache['content_lower']
+
+
+def _find_section(paper: ParsedPaper, section_name: str) -> Optional[PaperSection]:
+    """First section whose title contains section_name, ignoring case; memoized per paper."""
+    lookups = _object_cache(paper).setdefault('section_lookups', {})
+    name = section_name.lower()
+    if name not in lookups:
+        lookups[name] = next(
+            (section for section in paper.sections if name in _lower_title(section)), None)
+    return lookups[name]
+
+
+def _section_paragraphs(section: PaperSection) -> List[str]:
+    """Lowercased paragraphs of a section worth matching against, computed once."""
+    cache = _object_cache(section)
+    if 'paragraphs' not in cache:
+        cache['paragraphs'] = [
+            paragraph for paragraph in _lower_content(section).split('\n\n')
+            if len(paragraph.strip()) >= 50  # Skip very short paragraphs
+        ]
+    return cache['paragraphs']
+
+
+def _token_hashes(words: Iterable[str]) -> np.ndarray:
+    """Sorted unique 64-bit hashes of words, for C-level set intersection."""
+    return np.unique(np.fromiter(
+        (hash(word) & 0xFFFFFFFFFFFFFFFF for word in words), dtype=np.uint64))
+
+
+def _paragraph_token_hashes(section: PaperSection) -> List[np.ndarray]:
+    """Token hashes of each of a section's paragraphs, tokenized once."""
+    cache = _object_cache(section)
+    if 'paragraph_hashes' not in cache:
+        _tokenize_paragraphs(section)
+    return cache['paragraph_hashes']
+
+
+def _content_token_hashes(section: PaperSection) -> np.ndarray:
+    """Token hashes of a section's whole content, tokenized once."""
+    cache = _object_cache(section)
+    if 'content_hashes' not in cache:
+        _tokenize_paragraphs(section)
+    return cache['content_hashes']
+
+
+def _tokenize_paragraphs(section: PaperSection) -> None:
+    """Cache paragraph and content token hashes from a single tokenization pass.
+
+    Words never span a paragraph break, so the content's tokens are the
+    union of its paragraphs' tokens, short paragraphs included.
+    """
+    paragraphs = _lower_content(section).split('\n\n')
+    all_hashes = [_token_hashes(_WORD_RE.findall(paragraph)) for paragraph in paragraphs]
+
+    cache = _object_cache(section)
+    cache['paragraph_hashes'] = [
+        hashes for paragraph, hashes in zip(paragraphs, all_hashes)
+        if len(paragraph.strip()) >= 50  # Same paragraphs as _section_paragraphs
+    ]
+    cache['content_hashes'] = np.unique(np.concatenate(all_hashes))
+
+
+def _section_text(section: PaperSection) -> Tuple[str, int]:
+    """A section's "title\ncontent" text and its length, built once per section."""
+    cache = _object_cache(section)
+    if 'text' not in cache:
+        text = f"{section.title}\n{section.content}"
+        cache['text'] = (text, len(text))
+    return cache['text']
+
+
+def _union_pattern(patterns: List[re.Pattern]) -> re.Pattern:
+    """Case-insensitive regex that matches wherever any of the given patterns match."""
+    return re.compile('|'.join(f"(?:{pattern.pattern.replace('(?i)', '', 1)})" for pattern in patterns),
+                      re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _detect_question_type(question_lower: str, any_question_type_re: re.Pattern,
+                          question_type_res: Tuple[Tuple[str, re.Pattern], ...]) -> str:
+    """Detect the type of a lowercased, stripped question; memoized per question and patterns."""
+    # Handle very short/generic questions explicitly
+    if any(generic in question_lower for generic in _VERY_GENERIC):
+        return 'summary'  # Treat as summary rather than general for better handling
+
+    # Check patterns for each question type, in priority order
+    if any_question_type_re.search(question_lower):
+        for question_type, pattern in question_type_res:
+            if pattern.search(question_lower):
+                return question_type
+
+    # Better classification for borderline cases
+    # If question contains "what" and is short, likely wants summary
+    if 'what' in question_lower and len(question_lower.split()) <= 5:
+        return 'summary'
+
+    # If question asks about "how", likely methodology
+    if any(word in question_lower for word in ['how', 'method', 'approach', 'technique']):
+        return 'methodology'
+
+    # Default to general if no specific type detected
+    return 'general'
+
+
+def _best_answer_spans(start_logits: np.ndarray, end_logits: np.ndarray, context_start: int,
+                       context_length: int, top_k: int = 12,
+                       max_answer_len: int = 15) -> Tuple[List[Tuple[float, int, int]], float]:
+    """Most probable answer spans among the context tokens of one QA window.
+
+    Returns up to top_k (score, first token, last token) spans, best first and
+    with tokens relative to the context, and the score of the "no answer"
+    (CLS) position. The QA pipeline keeps 12 candidates per window since
+    several of them may widen to the same words.
+    """
+    # Only context tokens and the leading CLS token take part in the softmax
+    allowed = np.zeros(len(start_logits), dtype=bool)
+    allowed[0] = True
+    allowed[context_start:context_start + context_length] = True
+    start_probs = _masked_softmax(start_logits, allowed)
+    end_probs = _masked_softmax(end_logits, allowed)
+    null_score = float(start_probs[0] * end_probs[0])
+
+    context_end = context_start + context_length
+    scores = np.outer(start_probs[context_start:context_end], end_probs[context_start:context_end])
+    scores = np.tril(np.triu(scores), max_answer_len - 1)
+    flat_scores = scores.ravel()
+    if len(flat_scores) > top_k:
+        best = np.argpartition(-flat_scores, top_k)[:top_k]
+    else:
+        best = np.arange(len(flat_scores))
+    best = best[np.argsort(-flat_scores[best])]
+    firsts, lasts = np.unravel_index(best, scores.shape)
+    return ([(float(flat_scores[index]), int(first), int(last))
+             for index, first, last in zip(best, firsts, lasts)], null_score)
+
+
+def _word_spans(encoding: Any) -> List[Tuple[int, int]]:
+    """Character span of the whole word each token belongs to.
+
+    Answers are widened to word boundaries like the QA pipeline does;
+    tokens without a word keep their own offsets.
+    """
+    spans = []
+    word_chars: Dict[int, Tuple[int, int]] = {}
+    for offset, word in zip(encoding['offset_mapping'], encoding.word_ids()):
+        if word is None:
+            spans.append(tuple(offset))
+            continue
+        if word not in word_chars:
+            try:
+                word_chars[word] = tuple(encoding.word_to_chars(word))
+            except Exception:
+                word_chars[word] = tuple(offset)
+        spans.append(word_chars[word])
+    return spans
+
+
+def _masked_softmax(logits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Softmax over the masked-in positions; masked-out positions get zero."""
+    logits = np.where(mask, logits, -np.inf)
+    exp = np.exp(logits - logits.max())
+    return exp / exp.sum()
+
+
+def _join_until(parts: Iterable[str], limit: int) -> str:
+    """Space-join parts, consuming no more once the result exceeds limit characters."""
+    collected: List[str] = []
+    length = 0
+    for part in parts:
+        collected.append(part)
+        length += len(part) + 1
+        if length > limit:
+            break
+    return " ".join(collected)
+
 
 @dataclass
 class ResearchAnswer:
@@ -41,15 +409,44 @@ class QuestionContext:
 class AcademicQuestionAnswering:
     """Question answering system for academic papers."""
 
-    def __init__(self, config: Any):
+    def __init__(self, config: Any, embeddings: Optional["MultimodalResearchEmbeddings"] = None):
         self.config = config
-        self.embeddings = MultimodalResearchEmbeddings(config)
+        # Shared embedding models if given, otherwise loaded once a question needs them
+        self._embeddings = embeddings
+        self._embeddings_error: Optional[Exception] = None
 
         # Load QA model
         self._load_qa_model()
 
         # Question type patterns
         self.question_patterns = self._compile_question_patterns()
+        # One alternation per type, and one over all types to rule out a match in a single scan
+        self._question_type_res = tuple(
+            (question_type, _union_pattern(patterns))
+            for question_type, patterns in self.question_patterns.items()
+        )
+        self._any_question_type_re = _union_pattern(
+            [pattern for patterns in self.question_patterns.values() for pattern in patterns])
+
+        # Indicator patterns for rule-based answers
+        self.answer_patterns = self._compile_answer_patterns()
+
+        # Keyword matchers for rule-based answers (case-insensitive, no lowercasing)
+        self._method_title_re = re.compile(r'method|approach|model', re.IGNORECASE)
+        self._method_content_re = re.compile(
+            r'algorithm|approach|method|technique', re.IGNORECASE)
+        self._results_title_re = re.compile(
+            r'result|experiment|evaluation', re.IGNORECASE)
+
+        # Tokenized QA contexts, shared by questions with the same context
+        self._context_encodings: "OrderedDict[str, Tuple[List[int], List[Tuple[int, int]], List[Tuple[int, int]]]]" = OrderedDict()
+        self._context_encodings_size = 32
+
+        # Recently given answers, most recently used last
+        self._answer_cache: "OrderedDict[Tuple[Any, ...], ResearchAnswer]" = OrderedDict()
+        self._answer_cache_size = 256
+        # Requests served on different threads share the answer cache
+        self._answer_cache_lock = threading.Lock()
 
         # Section priorities for different question types
         self.section_priorities = {
@@ -63,6 +460,32 @@ class AcademicQuestionAnswering:
             'performance': ['results', 'experiments', 'evaluation']
         }
 
+        # Title keyword -> rank for each question type, normalized once
+        self._priority_ranks = {
+            question_type: {priority.replace('_', ' '): rank
+                            for rank, priority in enumerate(priorities)}
+            for question_type, priorities in self.section_priorities.items()
+        }
+
+    @property
+    def embeddings(self) -> "MultimodalResearchEmbeddings":
+        """Research embeddings, initialized on first use unless given at construction.
+
+        A failed load is not retried; later uses raise the same error.
+        """
+        if self._embeddings is None:
+            if self._embeddings_error is not None:
+                raise self._embeddings_error
+
+            from ..research_embeddings.academic_embeddings import MultimodalResearchEmbeddings
+
+            try:
+                self._embeddings = MultimodalResearchEmbeddings(self.config)
+            except Exception as e:
+                self._embeddings_error = e
+                raise
+        return self._embeddings
+
     def _load_qa_model(self):
         """Load question answering model."""
         try:
@@ -72,12 +495,13 @@ class AcademicQuestionAnswering:
             qa_model_name = getattr(
                 self.config.models, 'qa_model', 'distilbert-base-cased-distilled-squad')
 
-            self.qa_pipeline = pipeline(
-                "question-answering",
-                model=qa_model_name,
-                tokenizer=qa_model_name,
-                device=0 if torch.cuda.is_available() and self.config.models.device == "auto" else -1
+            self.qa_pipeline = _get_qa_pipeline(
+                qa_model_name,
+                0 if _cuda_available() and self.config.models.device == "auto" else -1,
+                getattr(self.config.models, 'quantize_cpu', False),
+                getattr(self.config.models, 'qa_cpu_dtype', "float32")
             )
+            self._tokenizer_lock = _qa_tokenizer_lock(self.qa_pipeline)
 
             logger.info("Question answering model loaded successfully")
 
@@ -85,63 +509,66 @@ class AcademicQuestionAnswering:
             logger.error(f"Failed to load QA model: {e}")
             # Fallback to a simpler approach
             self.qa_pipeline = None
+            self._tokenizer_lock = threading.RLock()
 
     def _compile_question_patterns(self) -> Dict[str, List[re.Pattern]]:
         """Compile regex patterns for question type detection."""
         patterns = {
             'contribution': [
-                re.compile(
-                    r'(?i)(main|key|primary|novel|new)\s*(contribution|novelty)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)what.*?(novel|new|contribution|significance)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)(significance|importance).*?(work|research|paper)', re.IGNORECASE),
+                re.compile(r'(?i)(main|key|primary|novel|new)\s*(contribution|novelty)'),
+                re.compile(r'(?i)what.*?(novel|new|contribution|significance)'),
+                re.compile(r'(?i)(significance|importance).*?(work|research|paper)'),
             ],
             'methodology': [
-                re.compile(
-                    r'(?i)(method|approach|algorithm|technique|procedure)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)how.*?(implement|design|build|create|develop)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)(experimental|evaluation)\s*(setup|design|protocol)', re.IGNORECASE),
+                re.compile(r'(?i)(method|approach|algorithm|technique|procedure)'),
+                re.compile(r'(?i)how.*?(implement|design|build|create|develop)'),
+                re.compile(r'(?i)(experimental|evaluation)\s*(setup|design|protocol)'),
             ],
             'results': [
-                re.compile(
-                    r'(?i)(result|finding|outcome|performance|accuracy)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)what.*?(achieve|obtain|find|discover)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)(evaluation|experiment).*?(result|outcome)', re.IGNORECASE),
+                re.compile(r'(?i)(result|finding|outcome|performance|accuracy)'),
+                re.compile(r'(?i)what.*?(achieve|obtain|find|discover)'),
+                re.compile(r'(?i)(evaluation|experiment).*?(result|outcome)'),
             ],
             'limitations': [
-                re.compile(
-                    r'(?i)(limitation|weakness|constraint|problem)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)what.*?(limit|constrain|prevent|issue)', re.IGNORECASE),
-                re.compile(r'(?i)(challenge|difficulty|drawback)',
-                           re.IGNORECASE),
+                re.compile(r'(?i)(limitation|weakness|constraint|problem)'),
+                re.compile(r'(?i)what.*?(limit|constrain|prevent|issue)'),
+                re.compile(r'(?i)(challenge|difficulty|drawback)'),
             ],
             'summary': [
-                re.compile(
-                    r'(?i)(summarize|summary|overview|abstract)', re.IGNORECASE),
-                re.compile(r'(?i)what.*?(about|discuss|cover)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)(explain|describe).*?(paper|work|research)', re.IGNORECASE),
+                re.compile(r'(?i)(summarize|summary|overview|abstract)'),
+                re.compile(r'(?i)what.*?(about|discuss|cover)'),
+                re.compile(r'(?i)(explain|describe).*?(paper|work|research)'),
             ],
             'dataset': [
-                re.compile(r'(?i)(dataset|data|corpus|benchmark)',
-                           re.IGNORECASE),
-                re.compile(r'(?i)what.*?(data|dataset|corpus)', re.IGNORECASE),
-                re.compile(
-                    r'(?i)(evaluation|experiment).*?(data|dataset)', re.IGNORECASE),
+                re.compile(r'(?i)(dataset|data|corpus|benchmark)'),
+                re.compile(r'(?i)what.*?(data|dataset|corpus)'),
+                re.compile(r'(?i)(evaluation|experiment).*?(data|dataset)'),
             ],
             'comparison': [
-                re.compile(
-                    r'(?i)(compare|comparison|versus|vs|differ)', re.IGNORECASE),
-                re.compile(r'(?i)how.*?(different|similar|compare)',
-                           re.IGNORECASE),
-                re.compile(
-                    r'(?i)(baseline|previous|prior).*?(work|method)', re.IGNORECASE),
+                re.compile(r'(?i)(compare|comparison|versus|vs|differ)'),
+                re.compile(r'(?i)how.*?(different|similar|compare)'),
+                re.compile(r'(?i)(baseline|previous|prior).*?(work|method)'),
+            ]
+        }
+
+        return patterns
+
+    def _compile_answer_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """Compile regex patterns marking contributions and limitations in paper text."""
+        patterns = {
+            'contribution': [
+                re.compile(r'(?i)contribution[s]?\s*(?:of this work|include|are|is)'),
+                re.compile(r'(?i)we\s*(?:propose|introduce|present|develop|contribute)'),
+                re.compile(r'(?i)(?:main|key|primary|novel)\s*(?:contribution|novelty|innovation)'),
+                re.compile(r'(?i)our\s*(?:approach|method|work|contribution)'),
+                re.compile(r'(?i)(?:significance|importance).*?(?:work|research)'),
+            ],
+            'limitations': [
+                re.compile(r'(?i)limitation[s]?\s*(?:of|include|are|is)'),
+                re.compile(r'(?i)(?:however|but|although).*?(?:limitation|constraint|issue)'),
+                re.compile(r'(?i)(?:weakness|drawback|shortcoming)'),
+                re.compile(r'(?i)future\s*work'),
+                re.compile(r'(?i)(?:cannot|unable to|difficult to)'),
             ]
         }
 
@@ -149,45 +576,64 @@ class AcademicQuestionAnswering:
 
     def detect_question_type(self, question: str) -> str:
         """Detect the type of research question with improved general question handling."""
-        question_lower = question.lower().strip()
-        
-        # Handle very short/generic questions explicitly
-        very_generic = [
-            'what is this',
-            'what is that',
-            'what is it',
-            'describe this',
-            'tell me about this',
-            'what does this say',
-            'what is the content',
-            'what is in this',
-            'explain this',
-            'summarize this'
-        ]
-        
-        if any(generic in question_lower for generic in very_generic):
-            return 'summary'  # Treat as summary rather than general for better handling
-        
-        # Check patterns for each question type
-        for question_type, patterns in self.question_patterns.items():
-            for pattern in patterns:
-                if pattern.search(question_lower):
-                    return question_type
-
-        # Better classification for borderline cases
-        # If question contains "what" and is short, likely wants summary
-        if 'what' in question_lower and len(question.split()) <= 5:
-            return 'summary'
-        
-        # If question asks about "how", likely methodology
-        if any(word in question_lower for word in ['how', 'method', 'approach', 'technique']):
-            return 'methodology'
-            
-        # Default to general if no specific type detected
-        return 'general'
+        return _detect_question_type(question.lower().strip(), self._any_question_type_re,
+                                     self._question_type_res)
 
     def answer_question(self, question: str, paper: ParsedPaper) -> ResearchAnswer:
         """Answer a question about a research paper."""
+        return self.answer_questions([question], paper)[0]
+
+    def answer_questions(self, questions: List[str], paper: ParsedPaper) -> List[ResearchAnswer]:
+        """Answer several questions about a paper, batching the QA model calls."""
+        return self.answer_question_batch([(question, paper) for question in questions])
+
+    def answer_question_batch(self, questions_and_papers: List[Tuple[str, ParsedPaper]]) -> List[ResearchAnswer]:
+        """Answer questions about any number of papers, batching the QA model calls.
+
+        Contexts are prepared in parallel, then the model runs once over all
+        distinct (question, context) pairs.
+        """
+        answers: List[Optional[ResearchAnswer]] = []
+        pending = []
+        for index, (question, paper) in enumerate(questions_and_papers):
+            cache_key = (_paper_cache_key(paper), question.strip().lower())
+            cached_answer = self._get_cached_answer(cache_key)
+            answers.append(cached_answer)
+            if cached_answer is None:
+                pending.append((index, cache_key, question, paper))
+
+        if len(pending) > 1:
+            prepared = list(_cpu_pool().map(
+                lambda item: self._prepare_question(item[2], item[3]), pending))
+        else:
+            prepared = [self._prepare_question(question, paper) for _, _, question, paper in pending]
+
+        # Run the model once over all distinct (question, context) pairs
+        model_answers = {}
+        if self.qa_pipeline:
+            pairs = list(dict.fromkeys(
+                (question, context) for (_, _, question, _), (_, _, context) in zip(pending, prepared)
+                if context))
+            if pairs:
+                model_answers = dict(zip(pairs, self._generate_answers_with_model(pairs)))
+
+        for (index, cache_key, question, _), (question_type, relevant_sections, context) in zip(pending, prepared):
+            answer = model_answers.get((question, context))
+
+            # Use rules when there is no model or it found no answer span
+            if answer is None:
+                answer = self._generate_answer_with_rules(
+                    question, question_type, relevant_sections)
+            else:
+                answer = replace(answer)  # Repeated questions get their own copy
+
+            self._cache_answer(cache_key, answer)
+            answers[index] = answer
+
+        return answers
+
+    def _prepare_question(self, question: str, paper: ParsedPaper) -> Tuple[str, List[PaperSection], str]:
+        """Detect a question's type and gather its relevant sections and QA context."""
         logger.info(f"Answering question: {question}")
 
         # Detect question type
@@ -200,100 +646,323 @@ class AcademicQuestionAnswering:
         # Build context
         context = self._build_context(relevant_sections, question)
 
-        # Generate answer
-        if self.qa_pipeline and context:
-            answer = self._generate_answer_with_model(question, context)
-        else:
-            answer = self._generate_answer_with_rules(
-                question, question_type, relevant_sections)
+        return question_type, relevant_sections, context
 
-        return answer
+    def _get_cached_answer(self, key: Tuple[Any, ...]) -> Optional[ResearchAnswer]:
+        """Look up a previous answer, returning a copy the caller may modify."""
+        with self._answer_cache_lock:
+            answer = self._answer_cache.get(key)
+            if answer is None:
+                return None
+
+            self._answer_cache.move_to_end(key)
+        return replace(answer)
+
+    def _cache_answer(self, key: Tuple[Any, ...], answer: ResearchAnswer):
+        """Remember an answer, evicting the least recently used one when full."""
+        answer = replace(answer)
+        with self._answer_cache_lock:
+            self._answer_cache[key] = answer
+            self._answer_cache.move_to_end(key)
+            if len(self._answer_cache) > self._answer_cache_size:
+                self._answer_cache.popitem(last=False)
 
     def _get_relevant_sections(self, question_type: str, paper: ParsedPaper) -> List[PaperSection]:
         """Get sections most relevant to the question type."""
-        relevant_sections = []
-
+        # Section titles never change, so the ranking is done once per paper and type
+        cache = _object_cache(paper)
+        key = ('relevant_sections', question_type)
+        if key not in cache:
+            cache[key] = self._rank_relevant_sections(question_type, paper)
+        return list(cache[key])
+
+    def _rank_relevant_sections(self, question_type: str, paper: ParsedPaper) -> List[PaperSection]:
+        """Rank a paper's sections by the priority of the first keyword their title matches."""
         # Get priority sections for this question type
-        priority_sections = self.section_priorities.get(
-            question_type, ['abstract'])
-
-        # Find matching sections
-        for section in paper.sections:
-            section_title_lower = section.title.lower()
-
-            # Check if section matches priority keywords
-            for priority in priority_sections:
-                if priority.replace('_', ' ') in section_title_lower:
-                    relevant_sections.append(section)
-                    break
-
-        # If no specific sections found, use abstract and introduction
-        if not relevant_sections:
-            for section in paper.sections:
-                section_title_lower = section.title.lower()
-                if any(keyword in section_title_lower for keyword in ['abstract', 'introduction']):
-                    relevant_sections.append(section)
-
-        # Sort by relevance (priority sections first)
-        def section_priority_score(section):
-            section_title_lower = section.title.lower()
-            for i, priority in enumerate(priority_sections):
-                if priority.replace('_', ' ') in section_title_lower:
-                    return i
-            return len(priority_sections)
-
-        relevant_sections.sort(key=section_priority_score)
+        priority_ranks = self._priority_ranks.get(question_type, {'abstract': 0})
+
+        # Find matching sections along with the best priority they match
+        ranked_sections = []
+        top_rank_matches = 0
+        for index, section in enumerate(paper.sections):
+            section_title_lower = _lower_title(section)
+            rank = min((rank for keyword, rank in priority_ranks.items()
+                        if keyword in section_title_lower), default=None)
+            if rank is None:
+                continue
+
+            heapq.heappush(ranked_sections, (rank, index, section))
+            if rank == 0:
+                top_rank_matches += 1
+                if top_rank_matches == 3:
+                    break  # No later section can outrank these
+
+        if ranked_sections:
+            # Most relevant first (priority sections, then paper order)
+            relevant_sections = [
+                section for _, _, section in heapq.nsmallest(3, ranked_sections)]
+        else:
+            # If no specific sections found, use abstract and introduction
+            relevant_sections = [
+                section for section in paper.sections
+                if any(keyword in _lower_title(section) for keyword in ['abstract', 'introduction'])
+            ]
 
         return relevant_sections[:3]  # Limit to top 3 sections
 
     def _build_context(self, sections: List[PaperSection], question: str) -> str:
         """Build context for question answering."""
+        tokenizer = getattr(self.qa_pipeline, 'tokenizer', None)
+        if tokenizer is not None and tokenizer.is_fast:
+            return self._build_context_by_tokens(sections, question, tokenizer)
+
         context_parts = []
         max_length = self.config.research.max_context_length
         current_length = 0
 
         for section in sections:
-            section_text = f"{section.title}\n{section.content}"
+            text, length = _section_text(section)
+            remaining_length = max_length - current_length
 
-            if current_length + len(section_text) <= max_length:
-                context_parts.append(section_text)
-                current_length += len(section_text)
+            if length <= remaining_length:
+                context_parts.append(text)
+                current_length += length
             else:
                 # Truncate to fit
-                remaining_length = max_length - current_length
                 if remaining_length > 100:  # Only add if significant space remains
-                    truncated_text = section_text[:remaining_length] + "..."
-                    context_parts.append(truncated_text)
+                    context_parts.append(text[:remaining_length] + "...")
                 break
 
         return "\n\n".join(context_parts)
 
-    def _generate_answer_with_model(self, question: str, context: str) -> ResearchAnswer:
-        """Generate answer using the QA model."""
-        try:
-            result = self.qa_pipeline(question=question, context=context)
+    def _build_context_by_tokens(self, sections: List[PaperSection], question: str, tokenizer: Any) -> str:
+        """Build context spanning up to qa_max_windows of the QA model's sliding windows."""
+        window_tokens = self._qa_max_seq_len(tokenizer)
+        with self._tokenizer_lock:
+            window_tokens -= len(tokenizer.encode(question, add_special_tokens=False))
+            window_tokens -= tokenizer.num_special_tokens_to_add(pair=True)
 
-            answer_text = result['answer']
-            confidence = result['score']
+        # Consecutive windows overlap by doc_stride tokens
+        extra_windows = max(0, self.config.research.qa_max_windows - 1)
+        max_tokens = window_tokens + extra_windows * max(
+            0, window_tokens - self.config.research.qa_doc_stride)
 
-            # Extract source information
-            start = result['start']
-            end = result['end']
-            evidence_text = context[max(
-                0, start-100):min(len(context), end+100)]
+        context_parts = []
+        current_tokens = 0
 
-            return ResearchAnswer(
-                answer=answer_text,
-                confidence=confidence,
-                evidence_text=evidence_text,
-                context=context[:500] +
-                "..." if len(context) > 500 else context
+        for section in sections:
+            token_ends = self._section_token_ends(section, tokenizer)
+
+            if current_tokens + len(token_ends) <= max_tokens:
+                context_parts.append(_section_text(section)[0])
+                current_tokens += len(token_ends) + 1  # Separator token
+            else:
+                # Truncate at a token boundary
+                remaining_tokens = max_tokens - current_tokens
+                if remaining_tokens > 25:  # Only add if significant space remains
+                    text = _section_text(section)[0]
+                    context_parts.append(text[:token_ends[remaining_tokens - 1]] + "...")
+                break
+
+        return "\n\n".join(context_parts)
+
+    def _section_token_ends(self, section: PaperSection, tokenizer: Any) -> List[int]:
+        """End character offset of every token in a section's "title\ncontent" text."""
+        cache = _object_cache(section)
+        key = ('token_ends', tokenizer.name_or_path)
+        if key not in cache:
+            with self._tokenizer_lock:
+                encoding = tokenizer(_section_text(section)[0],
+                                     add_special_tokens=False, return_offsets_mapping=True)
+            cache[key] = [end for _, end in encoding['offset_mapping']]
+        return cache[key]
+
+    def _qa_max_seq_len(self, tokenizer: Any) -> int:
+        """Token length of a single QA model window."""
+        return min(tokenizer.model_max_length, self.config.models.max_length)
+
+    def _run_qa_pipeline(self, inputs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Run the QA pipeline over (question, context) pairs in batches.
+
+        Contexts longer than one model window are scored window by window.
+        """
+        import torch
+
+        with torch.inference_mode():
+            results = self.qa_pipeline(
+                question=[question for question, _ in inputs],
+                context=[context for _, context in inputs],
+                batch_size=min(len(inputs), self.config.models.batch_size),
+                max_seq_len=self._qa_max_seq_len(self.qa_pipeline.tokenizer),
+                doc_stride=self.config.research.qa_doc_stride,
+                handle_impossible_answer=True
             )
 
+        # A single input comes back as a bare result
+        return [results] if isinstance(results, dict) else results
+
+    def _run_qa(self, inputs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Find the best answer span for each (question, context) pair."""
+        if self.qa_pipeline.tokenizer.is_fast:
+            return self._run_qa_model(inputs)
+        return self._run_qa_pipeline(inputs)
+
+    def _run_qa_model(self, inputs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Run the QA model directly, reusing cached context tokenization.
+
+        Scores spans the same way as the question-answering pipeline: long
+        contexts are split into overlapping windows, each window's best spans
+        are widened to whole words, the scores of spans giving the same
+        answer are added up, and the best answer wins unless "no answer" is
+        more probable.
+        """
+        import torch
+
+        tokenizer = self.qa_pipeline.tokenizer
+        model = self.qa_pipeline.model
+        max_seq_len = self._qa_max_seq_len(tokenizer)
+        doc_stride = self.config.research.qa_doc_stride
+        with_token_types = 'token_type_ids' in tokenizer.model_input_names
+
+        with self._tokenizer_lock:
+            # Offset of the context from the end of the question in model inputs
+            probe = tokenizer.build_inputs_with_special_tokens([-1], [-2])
+            context_shift = probe.index(-2) - 1
+            special_tokens = tokenizer.num_special_tokens_to_add(pair=True)
+
+        # Split every context into windows, each preceded by its question
+        features = []
+        for index, (question, context) in enumerate(inputs):
+            with self._tokenizer_lock:
+                question_ids = tokenizer.encode(question, add_special_tokens=False)[:64]
+            context_ids, offsets, word_spans = self._encode_context(context)
+            window = max_seq_len - len(question_ids) - special_tokens
+
+            window_start = 0
+            while window_start < len(context_ids):
+                window_ids = context_ids[window_start:window_start + window]
+                # Words cut off by the window edge only count their tokens inside it
+                window_chars = (offsets[window_start][0], offsets[window_start + len(window_ids) - 1][1])
+                features.append((index, question_ids, window_ids,
+                                 context_shift + len(question_ids), window_start, (word_spans, window_chars)))
+                if window_start + window >= len(context_ids):
+                    break
+                window_start += max(1, window - doc_stride)
+
+        # Candidate answers of each input by lowercased answer text
+        candidates: List[Dict[str, Dict[str, Any]]] = [{} for _ in inputs]
+        null_scores: List[Optional[float]] = [None] * len(inputs)
+
+        batch_size = self.config.models.batch_size
+        for batch_start in range(0, len(features), batch_size):
+            batch = features[batch_start:batch_start + batch_size]
+
+            with self._tokenizer_lock:
+                sequences = [tokenizer.build_inputs_with_special_tokens(question_ids, window_ids)
+                             for _, question_ids, window_ids, _, _, _ in batch]
+                token_types = [tokenizer.create_token_type_ids_from_sequences(question_ids, window_ids)
+                               for _, question_ids, window_ids, _, _, _ in batch] if with_token_types else None
+            width = max(len(sequence) for sequence in sequences)
+            encoded = {'input_ids': torch.full((len(batch), width), tokenizer.pad_token_id, dtype=torch.long),
+                       'attention_mask': torch.zeros((len(batch), width), dtype=torch.long)}
+            if with_token_types:
+                encoded['token_type_ids'] = torch.zeros((len(batch), width), dtype=torch.long)
+
+            for row, sequence in enumerate(sequences):
+                encoded['input_ids'][row, :len(sequence)] = torch.tensor(sequence)
+                encoded['attention_mask'][row, :len(sequence)] = 1
+                if with_token_types:
+                    encoded['token_type_ids'][row, :len(sequence)] = torch.tensor(token_types[row])
+
+            with torch.inference_mode():
+                outputs = model(**{name: tensor.to(model.device) for name, tensor in encoded.items()})
+            start_logits = outputs.start_logits.float().cpu().numpy()
+            end_logits = outputs.end_logits.float().cpu().numpy()
+
+            for row, (index, _, window_ids, context_start, window_start, (word_spans, window_chars)) in enumerate(batch):
+                spans, null_score = _best_answer_spans(
+                    start_logits[row], end_logits[row], context_start, len(window_ids))
+
+                if null_scores[index] is None or null_score < null_scores[index]:
+                    null_scores[index] = null_score
+
+                for score, first, last in spans:
+                    start = max(word_spans[window_start + first][0], window_chars[0])
+                    end = min(word_spans[window_start + last][1], window_chars[1])
+                    answer = inputs[index][1][start:end]
+                    candidate = candidates[index].get(answer.lower())
+                    if candidate is None:
+                        candidates[index][answer.lower()] = {
+                            'score': score, 'start': start, 'end': end, 'answer': answer}
+                    else:
+                        candidate['score'] += score
+
+        results = []
+        for answers, null_score in zip(candidates, null_scores):
+            # The first of equally scored answers wins, as in the pipeline
+            best = max(answers.values(), key=lambda candidate: candidate['score'],
+                       default={'score': 0.0, 'start': 0, 'end': 0, 'answer': ''})
+            # "No answer" wins when it is more probable than the best answer
+            if null_score is not None and null_score > best['score']:
+                best = {'score': null_score, 'start': 0, 'end': 0, 'answer': ''}
+            results.append(best)
+
+        return results
+
+    def _encode_context(self, context: str) -> Tuple[List[int], List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Token ids of a QA context, their character offsets and the span of each token's word.
+
+        Cached across questions; the tokenizer lock also guards the cache.
+        """
+        with self._tokenizer_lock:
+            encoding = self._context_encodings.get(context)
+            if encoding is not None:
+                self._context_encodings.move_to_end(context)
+                return encoding
+
+            tokenized = self.qa_pipeline.tokenizer(
+                context, add_special_tokens=False, return_offsets_mapping=True)
+            encoding = (tokenized['input_ids'], tokenized['offset_mapping'], _word_spans(tokenized))
+
+            self._context_encodings[context] = encoding
+            if len(self._context_encodings) > self._context_encodings_size:
+                self._context_encodings.popitem(last=False)
+
+        return encoding
+
+    def _generate_answers_with_model(self, inputs: List[Tuple[str, str]]) -> List[Optional[ResearchAnswer]]:
+        """Generate answers using the QA model, None where no answer span was found."""
+        try:
+            results = self._run_qa(inputs)
         except Exception as e:
             logger.error(f"Error generating answer with model: {e}")
             # Fallback to rule-based approach
-            return self._generate_answer_with_rules(question, "general", [])
+            return [None] * len(inputs)
+
+        return [self._answer_from_model_result(result, context)
+                for (_, context), result in zip(inputs, results)]
+
+    def _answer_from_model_result(self, result: Dict[str, Any], context: str) -> Optional[ResearchAnswer]:
+        """Convert a QA pipeline result into an answer."""
+        answer_text = result['answer']
+        if not answer_text.strip():
+            return None
+
+        confidence = result['score']
+
+        # Extract source information
+        start = result['start']
+        end = result['end']
+        evidence_text = context[max(
+            0, start-100):min(len(context), end+100)]
+
+        return ResearchAnswer(
+            answer=answer_text,
+            confidence=confidence,
+            evidence_text=evidence_text,
+            context=context[:500] +
+            "..." if len(context) > 500 else context
+        )
 
     def _generate_answer_with_rules(self, question: str, question_type: str, sections: List[PaperSection]) -> ResearchAnswer:
         """Generate answer using rule-based approach."""
@@ -313,28 +982,9 @@ class AcademicQuestionAnswering:
 
     def _answer_contribution_question(self, sections: List[PaperSection]) -> ResearchAnswer:
         """Answer questions about paper contributions."""
-        contribution_text = ""
-
-        for section in sections:
-            content = section.content.lower()
-
-            # Look for contribution indicators
-            contribution_patterns = [
-                r'contribution[s]?\s*(?:of this work|include|are|is)',
-                r'we\s*(?:propose|introduce|present|develop|contribute)',
-                r'(?:main|key|primary|novel)\s*(?:contribution|novelty|innovation)',
-                r'our\s*(?:approach|method|work|contribution)',
-                r'(?:significance|importance).*?(?:work|research)'
-            ]
-
-            for pattern in contribution_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    # Extract surrounding context
-                    start = max(0, match.start() - 100)
-                    end = min(len(content), match.end() + 200)
-                    context = content[start:end]
-                    contribution_text += context + " "
+        # Look for contribution indicators; only the first 500 characters are used
+        contribution_text = _join_until(self._iter_indicator_contexts(
+            sections, 'contribution', before=100, after=200), 500)
 
         if contribution_text:
             answer = contribution_text.strip()[:500]
@@ -348,20 +998,42 @@ class AcademicQuestionAnswering:
             answer_type="contribution"
         )
 
+    def _iter_indicator_contexts(self, sections: List[PaperSection], kind: str,
+                                 before: int, after: int) -> Iterator[str]:
+        """Yield the text surrounding each indicator pattern match, section by section."""
+        for section in sections:
+            content = _lower_content(section)
+
+            for match_start, match_end in self._indicator_hits(section, kind):
+                # Extract surrounding context
+                start = max(0, match_start - before)
+                end = min(len(content), match_end + after)
+                yield content[start:end]
+
+    def _indicator_hits(self, section: PaperSection, kind: str) -> List[Tuple[int, int]]:
+        """Spans of a section's indicator pattern matches, found once per section."""
+        cache = _object_cache(section)
+        key = ('indicator_hits', kind)
+        if key not in cache:
+            content = _lower_content(section)
+            cache[key] = [match.span()
+                          for pattern in self.answer_patterns[kind]
+                          for match in pattern.finditer(content)]
+        return cache[key]
+
     def _answer_methodology_question(self, sections: List[PaperSection]) -> ResearchAnswer:
         """Answer questions about methodology."""
         method_text = ""
 
         for section in sections:
-            if any(keyword in section.title.lower() for keyword in ['method', 'approach', 'model']):
+            if self._method_title_re.search(section.title):
                 method_text = section.content[:500]
                 break
 
         if not method_text:
             # Look for methodology descriptions in any section
             for section in sections:
-                content = section.content.lower()
-                if any(keyword in content for keyword in ['algorithm', 'approach', 'method', 'technique']):
+                if self._method_content_re.search(section.content):
                     method_text = section.content[:500]
                     break
 
@@ -382,7 +1054,7 @@ class AcademicQuestionAnswering:
         results_text = ""
 
         for section in sections:
-            if any(keyword in section.title.lower() for keyword in ['result', 'experiment', 'evaluation']):
+            if self._results_title_re.search(section.title):
                 results_text = section.content[:500]
                 break
 
@@ -406,7 +1078,7 @@ class AcademicQuestionAnswering:
 
         # First, try to find abstract
         for section in sections:
-            if 'abstract' in section.title.lower():
+            if 'abstract' in _lower_title(section):
                 summary_text = section.content.strip()
                 source_section = section.title
                 break
@@ -414,7 +1086,7 @@ class AcademicQuestionAnswering:
         # If no abstract, look for introduction or first substantial section
         if not summary_text:
             for section in sections:
-                if any(keyword in section.title.lower() for keyword in ['introduction', 'intro', 'background']):
+                if any(keyword in _lower_title(section) for keyword in ['introduction', 'intro', 'background']):
                     # Take first part of introduction
                     summary_text = section.content[:800].strip()
                     source_section = section.title
@@ -448,27 +1120,9 @@ class AcademicQuestionAnswering:
 
     def _answer_limitations_question(self, sections: List[PaperSection]) -> ResearchAnswer:
         """Answer questions about limitations."""
-        limitations_text = ""
-
-        for section in sections:
-            content = section.content.lower()
-
-            # Look for limitation indicators
-            limitation_patterns = [
-                r'limitation[s]?\s*(?:of|include|are|is)',
-                r'(?:however|but|although).*?(?:limitation|constraint|issue)',
-                r'(?:weakness|drawback|shortcoming)',
-                r'future\s*work',
-                r'(?:cannot|unable to|difficult to)'
-            ]
-
-            for pattern in limitation_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    start = max(0, match.start() - 50)
-                    end = min(len(content), match.end() + 150)
-                    context = content[start:end]
-                    limitations_text += context + " "
+        # Look for limitation indicators
+        limitations_text = _join_until(self._iter_indicator_contexts(
+            sections, 'limitations', before=50, after=150), 500)
 
         if limitations_text:
             answer = limitations_text.strip()[:500]
@@ -483,17 +1137,18 @@ class AcademicQuestionAnswering:
         )
 
     def _answer_general_question(self, question: str, sections: List[PaperSection]) -> ResearchAnswer:
-        """Answer general questions using improved keyword matching and fallback strategies."""
+        """Answer general questions using embedding similarity, keyword matching and fallback strategies."""
         logger.info(f"Processing general question: {question}")
-        
+        question_lower = question.lower()
+
         # Handle very generic questions
-        if len(question.split()) <= 3 and any(word in question.lower() for word in ['what', 'this', 'that', 'it']):
+        if len(question.split()) <= 3 and any(word in question_lower for word in ['what', 'this', 'that', 'it']):
             # For generic questions like "what is this?", provide a general paper overview
             if sections:
                 # Try to find title/abstract first
                 title_abstract = ""
                 for section in sections:
-                    if any(keyword in section.title.lower() for keyword in ['title', 'abstract', 'summary']):
+                    if any(keyword in _lower_title(section) for keyword in ['title', 'abstract', 'summary']):
                         title_abstract = section.content[:800]
                         break
                 
@@ -509,96 +1164,197 @@ class AcademicQuestionAnswering:
                         answer_type="general"
                     )
         
-        # Extract keywords from question
-        question_words = set(re.findall(r'\b\w+\b', question.lower()))
-        question_words = {word for word in question_words if len(word) > 2}  # Include 3+ char words
-        
-        # Remove common stop words
-        stop_words = {'the', 'is', 'at', 'which', 'on', 'and', 'a', 'to', 'are', 'as', 'was', 'for', 'with', 'by'}
-        question_words = question_words - stop_words
+        # Extract keywords from question (3+ char words, no stop words)
+        question_words = frozenset(
+            word for word in _WORD_RE.findall(question_lower) if len(word) > 2
+        ) - _STOP_WORDS
+
+        # Nothing to match against, go straight to the paper overview
+        if not question_words:
+            return self._general_fallback(sections)
 
         best_match = ""
-        best_score = 0
-        best_section = None
 
-        # Search through sections for relevant content
-        for section in sections:
-            content = section.content.lower()
-            content_words = set(re.findall(r'\b\w+\b', content))
+        # Rank sections by embedding similarity, keyword overlap as fallback
+        best_section, best_score = self._rank_sections_by_embedding(
+            question, sections)
+        if best_section is None:
+            best_section, best_score = self._rank_sections_by_keywords(
+                question_words, sections)
 
-            # Calculate similarity
-            if question_words:
-                overlap = len(question_words.intersection(content_words))
-                score = overlap / len(question_words)
-            else:
-                score = 0
+        if best_section is not None:
+            # Find the most relevant paragraph
+            best_paragraph = self._best_paragraph(question_words, best_section)
+            best_match = best_paragraph[:600] if best_paragraph else _lower_content(best_section)[:600]
 
-            if score > best_score:
-                best_score = score
-                best_section = section
-                
-                # Find the most relevant paragraph
-                paragraphs = content.split('\n\n')
-                best_paragraph = ""
-                best_paragraph_score = 0
-
-                for paragraph in paragraphs:
-                    if len(paragraph.strip()) < 50:  # Skip very short paragraphs
-                        continue
-                        
-                    paragraph_words = set(re.findall(r'\b\w+\b', paragraph.lower()))
-                    if question_words:
-                        paragraph_overlap = len(question_words.intersection(paragraph_words))
-                        paragraph_score = paragraph_overlap / len(question_words)
-                    else:
-                        paragraph_score = 0
+        # Provide fallback answer if no good match found
+        if not (best_match and best_score > 0.1):
+            return self._general_fallback(
+                sections,
+                evidence_text=best_match[:300],
+                source_section=best_section.title if best_section else None
+            )
 
-                    if paragraph_score > best_paragraph_score:
-                        best_paragraph_score = paragraph_score
-                        best_paragraph = paragraph
+        return ResearchAnswer(
+            answer=best_match.strip(),
+            confidence=min(best_score * 0.8, 0.8),  # Cap confidence at 0.8
+            evidence_text=best_match[:300],
+            source_section=best_section.title,
+            answer_type="general"
+        )
 
-                best_match = best_paragraph[:600] if best_paragraph else content[:600]
+    def _general_fallback(self, sections: List[PaperSection], evidence_text: str = "",
+                          source_section: Optional[str] = None) -> ResearchAnswer:
+        """Fallback answer for general questions: provide a paper overview."""
+        if sections:
+            # Get the first substantial section (likely abstract or introduction)
+            fallback_content = ""
+            for section in sections:
+                if len(section.content.strip()) > 100:
+                    fallback_content = section.content[:500]
+                    break
 
-        # Provide fallback answer if no good match found
-        if best_match and best_score > 0.1:
-            answer = best_match.strip()
-            confidence = min(best_score * 0.8, 0.8)  # Cap confidence at 0.8
-        else:
-            # Fallback strategy: provide paper overview
-            if sections:
-                # Get the first substantial section (likely abstract or introduction)
-                fallback_content = ""
-                for section in sections:
-                    if len(section.content.strip()) > 100:
-                        fallback_content = section.content[:500]
-                        break
-                
-                if fallback_content:
-                    answer = f"Based on the available content: {fallback_content.strip()}"
-                    confidence = 0.4
-                else:
-                    answer = "I have access to this paper but couldn't find content specifically relevant to your question. Please try asking a more specific question about the paper's methodology, results, or contributions."
-                    confidence = 0.2
+            if fallback_content:
+                answer = f"Based on the available content: {fallback_content.strip()}"
+                confidence = 0.4
             else:
-                answer = "I don't have access to the paper content to answer your question. Please ensure the paper was properly uploaded and processed."
-                confidence = 0.1
+                answer = "I have access to this paper but couldn't find content specifically relevant to your question. Please try asking a more specific question about the paper's methodology, results, or contributions."
+                confidence = 0.2
+        else:
+            answer = "I don't have access to the paper content to answer your question. Please ensure the paper was properly uploaded and processed."
+            confidence = 0.1
 
         return ResearchAnswer(
             answer=answer,
             confidence=confidence,
-            evidence_text=best_match[:300] if best_match else "",
-            source_section=best_section.title if best_section else None,
+            evidence_text=evidence_text,
+            source_section=source_section,
             answer_type="general"
         )
 
+    def _best_paragraph(self, question_words: frozenset, section: PaperSection) -> str:
+        """Find the paragraph of a section sharing the most words with the question."""
+        paragraphs = _section_paragraphs(section)
+        if len(paragraphs) > 32:
+            return self._best_paragraph_vectorized(question_words, section)
+
+        question_hashes = _token_hashes(question_words)
+        best_paragraph = ""
+        best_paragraph_score = 0
+
+        for paragraph, paragraph_hashes in zip(paragraphs, _paragraph_token_hashes(section)):
+            paragraph_overlap = np.intersect1d(
+                question_hashes, paragraph_hashes, assume_unique=True).size
+            paragraph_score = paragraph_overlap / question_hashes.size
+
+            if paragraph_score > best_paragraph_score:
+                best_paragraph_score = paragraph_score
+                best_paragraph = paragraph
+
+        return best_paragraph
+
+    def _best_paragraph_vectorized(self, question_words: frozenset, section: PaperSection) -> str:
+        """Score all paragraphs at once against a cached paragraph-term matrix."""
+        cache = _object_cache(section)
+        if 'paragraph_terms' not in cache:
+            from sklearn.feature_extraction.text import CountVectorizer
+
+            vectorizer = CountVectorizer(
+                token_pattern=_WORD_RE.pattern, lowercase=False, binary=True)
+            matrix = vectorizer.fit_transform(_section_paragraphs(section)).tocsc()
+            cache['paragraph_terms'] = (vectorizer.vocabulary_, matrix)
+
+        vocabulary, matrix = cache['paragraph_terms']
+        columns = [vocabulary[word] for word in question_words if word in vocabulary]
+        if not columns:
+            return ""
+
+        # Number of question words present in each paragraph
+        overlaps = np.asarray(matrix[:, columns].sum(axis=1)).ravel()
+        best = int(np.argmax(overlaps))
+        return _section_paragraphs(section)[best] if overlaps[best] > 0 else ""
+
+    def set_section_vectors(self, sections: List[PaperSection], vectors: Iterable[np.ndarray]):
+        """Reuse embeddings of sections' "title content" text computed elsewhere, e.g. at upload."""
+        self._store_section_vectors(sections, np.vstack([np.ravel(vector) for vector in vectors]))
+
+    def _store_section_vectors(self, sections: List[PaperSection], vectors: np.ndarray):
+        """Unit-normalize section embeddings and attach them to their sections."""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1.0, norms)
+        for section, vector in zip(sections, vectors):
+            _object_cache(section)['vector'] = vector
+
+    def _section_vectors(self, sections: List[PaperSection]) -> np.ndarray:
+        """Get unit-normalized embeddings for sections, encoding each only once."""
+        missing = [s for s in sections if 'vector' not in _object_cache(s)]
+        if missing:
+            self._store_section_vectors(missing, self.embeddings.text_embeddings.encode_text(
+                [f"{s.title} {s.content}" for s in missing]))
+
+        return np.vstack([_object_cache(s)['vector'] for s in sections])
+
+    def _rank_sections_by_embedding(self, question: str, sections: List[PaperSection]) -> Tuple[Optional[PaperSection], float]:
+        """Find the section closest to the question by cosine similarity.
+
+        The score is the similarity above _UNRELATED_SIMILARITY rescaled to
+        0-1, so it can be thresholded like keyword overlap; 0 means no
+        section is related. The section is None if embeddings are unavailable.
+        """
+        if not sections:
+            return None, 0.0
+
+        try:
+            section_vectors = self._section_vectors(sections)
+            question_vector = self.embeddings.encode_for_search(question).ravel()
+        except Exception as e:
+            logger.warning(f"Embedding similarity unavailable, using keyword overlap: {e}")
+            return None, 0.0
+
+        norm = np.linalg.norm(question_vector)
+        if norm == 0:
+            return None, 0.0
+
+        scores = section_vectors @ (question_vector / norm)
+        best = int(np.argmax(scores))
+        score = (float(scores[best]) - _UNRELATED_SIMILARITY) / (1.0 - _UNRELATED_SIMILARITY)
+        return sections[best], max(score, 0.0)
+
+    def _rank_sections_by_keywords(self, question_words: frozenset, sections: List[PaperSection]) -> Tuple[Optional[PaperSection], float]:
+        """Find the section sharing the most words with the question."""
+        question_hashes = _token_hashes(question_words)
+        best_section = None
+        best_score = 0
+
+        for section in sections:
+            # Calculate similarity
+            overlap = np.intersect1d(
+                question_hashes, _content_token_hashes(section), assume_unique=True).size
+            score = overlap / question_hashes.size
+
+            if score > best_score:
+                best_score = score
+                best_section = section
+                if score == 1.0:
+                    break  # Every question word found, cannot do better
+
+        return best_section, best_score
+
     def answer_section_question(self, question: str, section_name: str, paper: ParsedPaper) -> ResearchAnswer:
         """Answer a question about a specific section."""
+        cache_key = (_paper_cache_key(paper), question.strip().lower(), section_name.lower())
+        cached_answer = self._get_cached_answer(cache_key)
+        if cached_answer is not None:
+            return cached_answer
+
+        answer = self._answer_section_question(question, section_name, paper)
+        self._cache_answer(cache_key, answer)
+        return answer
+
+    def _answer_section_question(self, question: str, section_name: str, paper: ParsedPaper) -> ResearchAnswer:
+        """Answer a question about a specific section, without the answer cache."""
         # Find the requested section
-        target_section = None
-        for section in paper.sections:
-            if section_name.lower() in section.title.lower():
-                target_section = section
-                break
+        target_section = _find_section(paper, section_name)
 
         if not target_section:
             return ResearchAnswer(
@@ -609,19 +1365,20 @@ class AcademicQuestionAnswering:
             )
 
         # Answer question in context of specific section
-        context = f"{target_section.title}\n{target_section.content}"
+        context = _section_text(target_section)[0]
 
         if self.qa_pipeline:
             try:
-                result = self.qa_pipeline(question=question, context=context)
-                return ResearchAnswer(
-                    answer=result['answer'],
-                    confidence=result['score'],
-                    evidence_text=context[max(
-                        0, result['start']-50):result['end']+50],
-                    source_section=target_section.title,
-                    page_number=target_section.page_start
-                )
+                result = self._run_qa([(question, context)])[0]
+                if result['answer'].strip():
+                    return ResearchAnswer(
+                        answer=result['answer'],
+                        confidence=result['score'],
+                        evidence_text=context[max(
+                            0, result['start']-50):result['end']+50],
+                        source_section=target_section.title,
+                        page_number=target_section.page_start
+                    )
             except:
                 pass
 
@@ -3,8 +3,6 @@
 Simple launcher for AI Research Assistant Web Interface
 """
 
-import subprocess
-import sys
 from pathlib import Path
 
 
@@ -19,14 +17,13 @@ def main():
     # Get the path to app.py
     app_path = Path(__file__).parent / "app.py"
 
-    # Launch Streamlit
+    # Launch Streamlit in this process, as "streamlit run" does
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run",
-            str(app_path),
-            "--server.port", "8501",
-            "--server.address", "0.0.0.0"
-        ])
+        from streamlit.web import bootstrap
+
+        flag_options = {"server_port": 8501, "server_address": "0.0.0.0"}
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(app_path), False, [], flag_options)
     except KeyboardInterrupt:
         print("\n👋 Shutting down AI Research Assistant...")
     except Exception as e:
@@ -4,6 +4,7 @@ Quick status check for AI Research Assistant
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -18,12 +19,14 @@ def check_status():
     # Test core imports
     try:
         from src.research_assistant import ResearchAssistant
-        print("✅ Core system: Ready")
 
-        # Quick initialization test
-        assistant = ResearchAssistant()
-        papers = assistant.list_papers()
-        print(f"✅ Paper database: Ready ({len(papers)} papers)")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Quick initialization test, loading models while status prints
+            pending_assistant = pool.submit(ResearchAssistant)
+            print("✅ Core system: Ready")
+
+            assistant = pending_assistant.result()
+        print(f"✅ Paper database: Ready ({assistant.count_papers()} papers)")
 
         print("✅ Question answering: Ready")
         print("✅ PDF processing: Ready")
@@ -162,29 +162,11 @@ For support or questions, check:
 """
 
 import sys
-from pathlib import Path
 
 
 def main():
     """Display the success summary"""
-    # Get the current file content
-    current_file = Path(__file__)
-    content = current_file.read_text()
-
-    # Extract and print the summary (everything after the docstring)
-    lines = content.split('\n')
-    in_docstring = False
-    summary_lines = []
-
-    for line in lines:
-        if line.strip().startswith('"""') and not in_docstring:
-            in_docstring = True
-        elif line.strip().endswith('"""') and in_docstring:
-            in_docstring = False
-        elif in_docstring:
-            summary_lines.append(line)
-
-    print('\n'.join(summary_lines))
+    print(__doc__.strip('\n'))
 
     # Show current status
     print("\n" + "="*60)
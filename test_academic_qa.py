@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Tests for academic question answering
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+academic_qa = pytest.importorskip("src.research_qa.academic_qa")
+
+# Words of the generated contexts; the multi-piece ones split into several tokens
+WHOLE_WORDS = ("the", "model", "paper", "data", "we", "results", "method", "show",
+               "train", "test", "a", "of", "on", "and", "is", "set", "loss", "score")
+WORD_PIECES = ("trans", "##former", "##s", "atten", "##tion", "bench", "##mark",
+               "embed", "##ding", "re", "##sult")
+MULTI_PIECE_WORDS = ("transformer", "transformers", "attention", "benchmark",
+                     "benchmarks", "embedding", "embeddings", "result")
+
+
+def _softmax(logits, allowed):
+    """Reference softmax over the allowed positions."""
+    exp = np.exp(logits[allowed] - logits[allowed].max())
+    probs = np.zeros(len(logits))
+    probs[allowed] = exp / exp.sum()
+    return probs
+
+
+class FakeEncoding(dict):
+    """Tokenizer output with the word lookups of a fast tokenizer's encoding."""
+
+    def __init__(self, offsets, words, word_chars):
+        super().__init__(offset_mapping=offsets)
+        self._words = words
+        self._word_chars = word_chars
+
+    def word_ids(self):
+        return self._words
+
+    def word_to_chars(self, word):
+        if word not in self._word_chars:
+            raise ValueError(f"no characters for word {word}")
+        return self._word_chars[word]
+
+
+class TestBestAnswerSpans:
+    """Test span scoring within one QA window."""
+
+    def test_matches_brute_force(self):
+        """Test the kept spans against scoring every span."""
+        rng = np.random.default_rng(0)
+        start_logits = rng.normal(size=40)
+        end_logits = rng.normal(size=40)
+        context_start, context_length = 7, 30
+
+        spans, null_score = academic_qa._best_answer_spans(
+            start_logits, end_logits, context_start, context_length, top_k=5, max_answer_len=4)
+
+        allowed = np.zeros(40, dtype=bool)
+        allowed[0] = True
+        allowed[context_start:context_start + context_length] = True
+        start_probs = _softmax(start_logits, allowed)
+        end_probs = _softmax(end_logits, allowed)
+        expected = sorted(
+            ((start_probs[context_start + first] * end_probs[context_start + last], first, last)
+             for first in range(context_length)
+             for last in range(first, min(first + 4, context_length))),
+            reverse=True)[:5]
+
+        assert [(first, last) for _, first, last in spans] == [
+            (first, last) for _, first, last in expected]
+        assert [score for score, _, _ in spans] == pytest.approx(
+            [score for score, _, _ in expected])
+        assert null_score == pytest.approx(start_probs[0] * end_probs[0])
+
+    def test_ignores_question_tokens(self):
+        """Test that spans never start or end outside the context."""
+        start_logits = np.zeros(20)
+        end_logits = np.zeros(20)
+        # The question tokens are the most likely start and end by far
+        start_logits[1:5] = 50.0
+        end_logits[1:5] = 50.0
+        start_logits[12] = 5.0
+        end_logits[13] = 5.0
+
+        spans, _ = academic_qa._best_answer_spans(start_logits, end_logits, 6, 10, top_k=1)
+
+        assert [(first, last) for _, first, last in spans] == [(6, 7)]
+
+    def test_short_context_keeps_every_span(self):
+        """Test that a context with fewer spans than top_k returns them all."""
+        spans, _ = academic_qa._best_answer_spans(np.zeros(5), np.zeros(5), 2, 2, top_k=12)
+
+        assert len(spans) == 4
+        assert sorted((first, last) for _, first, last in spans[:3]) == [(0, 0), (0, 1), (1, 1)]
+        # The reversed span scores zero and comes last
+        assert [score for score, _, _ in spans] == pytest.approx([1 / 9] * 3 + [0.0])
+
+
+class TestWordSpans:
+    """Test widening of token offsets to whole words."""
+
+    def test_tokens_take_their_word_span(self):
+        """Test that every piece of a word gets the whole word's characters."""
+        # "attention is" split as atten ##tion is
+        encoding = FakeEncoding([(0, 5), (5, 9), (10, 12)], [0, 0, 1],
+                                {0: (0, 9), 1: (10, 12)})
+
+        assert academic_qa._word_spans(encoding) == [(0, 9), (0, 9), (10, 12)]
+
+    def test_tokens_without_a_word_keep_their_offsets(self):
+        """Test special tokens and words the tokenizer cannot locate."""
+        encoding = FakeEncoding([(0, 0), (0, 4), (5, 8)], [None, 0, 1], {0: (0, 4)})
+
+        assert academic_qa._word_spans(encoding) == [(0, 0), (0, 4), (5, 8)]
+
+
+@pytest.fixture(scope="module")
+def qa_system(tmp_path_factory):
+    """QA system running a small randomly initialized model, no download needed."""
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    from src.config import Config
+
+    vocab_file = tmp_path_factory.mktemp("qa-model") / "vocab.txt"
+    vocab_file.write_text("\n".join(
+        ("[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ".", ",") + WHOLE_WORDS + WORD_PIECES) + "\n")
+    tokenizer = transformers.BertTokenizerFast(vocab_file=str(vocab_file), model_max_length=64)
+
+    torch.manual_seed(0)
+    model = transformers.BertForQuestionAnswering(transformers.BertConfig(
+        vocab_size=tokenizer.vocab_size, hidden_size=32, num_hidden_layers=2,
+        num_attention_heads=2, intermediate_size=64, max_position_embeddings=128,
+        initializer_range=0.5))
+    model.eval()
+    try:
+        qa_pipeline = transformers.pipeline("question-answering", model=model, tokenizer=tokenizer)
+    except KeyError:
+        pytest.skip("this transformers release has no question-answering pipeline")
+
+    config = Config()
+    config.models.device = "cpu"
+    config.models.batch_size = 8
+    config.research.qa_doc_stride = 16
+
+    patch = pytest.MonkeyPatch()
+    patch.setattr(academic_qa, "_get_qa_pipeline", lambda *args, **kwargs: qa_pipeline)
+    try:
+        yield academic_qa.AcademicQuestionAnswering(config)
+    finally:
+        patch.undo()
+
+
+def _generated_inputs(count, seed=0):
+    """(question, context) pairs of 5 to 120 words, many longer than one window."""
+    rng = random.Random(seed)
+    words = WHOLE_WORDS + MULTI_PIECE_WORDS
+    inputs = []
+    for _ in range(count):
+        question = " ".join(rng.choice(words) for _ in range(rng.randint(2, 6))) + "?"
+        context_words = [rng.choice(words).capitalize() if rng.random() < 0.1 else rng.choice(words)
+                         for _ in range(rng.randint(5, 120))]
+        context = " ".join(word + rng.choice(("", "", "", ".", ",")) for word in context_words)
+        inputs.append((question, context))
+    return inputs
+
+
+def test_run_qa_model_matches_pipeline(qa_system):
+    """Test that the direct model path answers exactly like the QA pipeline."""
+    inputs = _generated_inputs(120)
+    tokenizer = qa_system.qa_pipeline.tokenizer
+    window = qa_system._qa_max_seq_len(tokenizer)
+    assert any(len(tokenizer.encode(context)) > window for _, context in inputs)
+
+    expected = qa_system._run_qa_pipeline(inputs)
+    actual = qa_system._run_qa_model(inputs)
+
+    for (question, context), want, got in zip(inputs, expected, actual):
+        assert (got['answer'], got['start'], got['end']) == (want['answer'], want['start'], want['end']), \
+            (question, context)
+        assert got['score'] == pytest.approx(want['score'], rel=1e-4, abs=1e-7)
+
+
+def test_run_qa_model_single_input(qa_system):
+    """Test one question at a time, without padding from other inputs."""
+    for question, context in _generated_inputs(10, seed=1):
+        [want] = qa_system._run_qa_pipeline([(question, context)])
+        [got] = qa_system._run_qa_model([(question, context)])
+
+        assert (got['answer'], got['start'], got['end']) == (want['answer'], want['start'], want['end'])
+        assert got['score'] == pytest.approx(want['score'], rel=1e-4, abs=1e-7)
+
+
+class FakeEmbeddings:
+    """Embeddings returning a fixed vector for every question."""
+
+    def __init__(self, question_vector):
+        self.question_vector = np.asarray(question_vector, dtype=float)
+
+    def encode_for_search(self, content):
+        return self.question_vector
+
+
+@pytest.fixture
+def rule_based_qa(monkeypatch):
+    """QA system without a QA model, answering with rules only."""
+    from src.config import Config
+
+    def no_model(*args, **kwargs):
+        raise RuntimeError("no QA model in tests")
+
+    monkeypatch.setattr(academic_qa, "_get_qa_pipeline", no_model)
+    return academic_qa.AcademicQuestionAnswering(Config())
+
+
+@pytest.fixture
+def embedded_sections(rule_based_qa):
+    """Two sections with one-hot embeddings attached."""
+    from src.paper_processor.pdf_parser import PaperSection
+
+    sections = [
+        PaperSection("Introduction", "We study how transformers attend to long research papers "
+                     "and why attention over sections helps readers.", 1, 1, 1),
+        PaperSection("Training", "The optimizer warms up the learning rate for four thousand steps "
+                     "and then decays it with the inverse square root.", 1, 2, 2),
+    ]
+    rule_based_qa.set_section_vectors(sections, [np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0])])
+    return sections
+
+
+class TestGeneralQuestions:
+    """Test section ranking for general questions."""
+
+    def test_related_question_answers_from_closest_section(self, rule_based_qa, embedded_sections):
+        """Test that a question close to a section is answered from it."""
+        rule_based_qa._embeddings = FakeEmbeddings([0.2, 0.9, 0.1])
+
+        answer = rule_based_qa._answer_general_question(
+            "How does the optimizer schedule the learning rate?", embedded_sections)
+
+        assert answer.source_section == "Training"
+        assert "learning rate" in answer.answer
+        assert 0.5 < answer.confidence <= 0.8
+
+    def test_unrelated_question_takes_fallback(self, rule_based_qa, embedded_sections):
+        """Test that low but positive similarity does not count as a match."""
+        # Cosine of about 0.15 with each section, as unrelated sentence embeddings score
+        rule_based_qa._embeddings = FakeEmbeddings([0.15, 0.15, 0.98])
+
+        answer = rule_based_qa._answer_general_question(
+            "Which restaurant serves the best pizza downtown?", embedded_sections)
+
+        assert answer.answer.startswith("Based on the available content:")
+        assert answer.confidence == 0.4
@@ -3,15 +3,63 @@
 Test script for the AI Research Assistant
 """
 
-from src.config import Config
-from src.research_assistant import ResearchAssistant
-import sys
+import os
+import hashlib
 from pathlib import Path
 import tempfile
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+# Downloaded papers are kept between runs; arXiv PDFs never change
+_SAMPLE_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) \
+    / "ai-research-assistant" / "test-samples"
+
+# Questions asked about the sample paper
+TEST_QUESTIONS = (
+    "What is the main contribution of this paper?",
+    "Summarize the abstract",
+    "What methodology does this paper use?",
+    "What are the key results?",
+)
+
+
+def _cached_paper_path(url):
+    """Where the sample paper downloaded from url is cached."""
+    return _SAMPLE_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.pdf"
+
+
+@lru_cache(maxsize=None)
+def _http_pool():
+    """Shared connections, so retries and later downloads skip the TLS handshake."""
+    # Imported here so collecting tests doesn't need urllib3
+    import urllib3
+
+    return urllib3.PoolManager(
+        num_pools=4, maxsize=8, retries=urllib3.Retry(total=3, backoff_factor=0.5))
+
+
+def _fetch_paper(url):
+    """Stream a paper's PDF into the sample cache and return its path."""
+    import urllib3
+
+    print(f"Downloading sample paper from {url}...")
+    _SAMPLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(suffix='.part', dir=_SAMPLE_CACHE_DIR, delete=False) as f:
+        try:
+            response = _http_pool().request("GET", url, preload_content=False, timeout=30.0)
+            try:
+                if response.status != 200:
+                    raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+                for chunk in response.stream(65536):
+                    f.write(chunk)
+            finally:
+                response.release_conn()
+        except BaseException:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+
+    # Publish only complete downloads
+    return str(Path(f.name).replace(_cached_paper_path(url)))
 
 
 def download_sample_paper():
@@ -23,17 +71,27 @@ def download_sample_paper():
     ]
 
     for url in sample_urls:
-        try:
-            print(f"Downloading sample paper from {url}...")
-            response = urllib.request.urlopen(url, timeout=30)
+        cached_path = _cached_paper_path(url)
+        if cached_path.exists() and cached_path.stat().st_size > 0:
+            return str(cached_path)
+
+    # Download all papers at once and keep whichever arrives first
+    pool = ThreadPoolExecutor(max_workers=len(sample_urls))
+    futures = {pool.submit(_fetch_paper, url): url for url in sample_urls}
+    try:
+        for future in as_completed(futures):
+            try:
+                paper_path = future.result()
+            except Exception as e:
+                print(f"Failed to download {futures[future]}: {e}")
+                continue
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
-                f.write(response.read())
-                return f.name
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            continue
+            return paper_path
+    finally:
+        # Don't wait for the slower downloads; they still fill the cache
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
 
     return None
 
@@ -42,6 +100,9 @@ def test_research_assistant():
     """Test the research assistant functionality."""
     print("🔬 Testing AI Research Assistant...")
 
+    from src.config import Config
+    from src.research_assistant import ResearchAssistant
+
     # Initialize the assistant
     config = Config()
     assistant = ResearchAssistant(config)
@@ -59,23 +120,16 @@ def test_research_assistant():
             print(f"✅ Paper uploaded with ID: {paper_id}")
 
             # Test questions
-            test_questions = [
-                "What is the main contribution of this paper?",
-                "Summarize the abstract",
-                "What methodology does this paper use?",
-                "What are the key results?",
-            ]
-
             print("\\n❓ Testing questions...")
-            for question in test_questions:
-                print(f"\\nQ: {question}")
-                try:
-                    answer = assistant.ask_question(question, paper_id)
+            try:
+                answers = assistant.ask_questions(TEST_QUESTIONS, paper_id)
+                for question, answer in zip(TEST_QUESTIONS, answers):
+                    print(f"\\nQ: {question}")
                     print(f"A: {answer.answer[:200]}...")
-                    if answer.evidence:
-                        print(f"Evidence: {answer.evidence[:100]}...")
-                except Exception as e:
-                    print(f"Error answering question: {e}")
+                    if answer.evidence_text:
+                        print(f"Evidence: {answer.evidence_text[:100]}...")
+            except Exception as e:
+                print(f"Error answering questions: {e}")
 
             # Test paper analysis
             print("\\n📊 Testing paper analysis...")
@@ -87,10 +141,6 @@ def test_research_assistant():
 
         except Exception as e:
             print(f"❌ Error processing paper: {e}")
-
-        finally:
-            # Clean up
-            Path(paper_path).unlink(missing_ok=True)
     else:
         print("❌ Could not download sample paper. Testing with mock data...")
 
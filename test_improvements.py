@@ -4,41 +4,29 @@ Enhanced test suite for AI Research Assistant improvements
 """
 
 import pytest
+import os
 import tempfile
 import json
 from pathlib import Path
 from datetime import datetime
-import sys
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
 
-try:
-    from src.research_assistant import ResearchAssistant
-    from src.config import Config
-except ImportError:
-    # Handle import error gracefully
-    ResearchAssistant = None
-    Config = None
+@pytest.fixture(scope="session")
+def config():
+    """Default configuration shared by all tests."""
+    return pytest.importorskip("src.config").Config()
+
 
 class TestImprovedFeatures:
     """Test the improved features of the application."""
     
-    def setup_method(self):
-        """Setup test environment."""
-        if ResearchAssistant is None:
-            pytest.skip("ResearchAssistant module not available")
-            
-        self.assistant = ResearchAssistant()
-        
     def test_file_validation(self):
         """Test file validation functionality."""
         # Test file size validation
-        large_file_data = b"x" * (60 * 1024 * 1024)  # 60MB
         with tempfile.NamedTemporaryFile(suffix='.pdf') as tmp:
-            tmp.write(large_file_data)
-            tmp.flush()
-            
+            # Sparse 60MB file: only the size is recorded, no data is written
+            os.ftruncate(tmp.fileno(), 60 * 1024 * 1024)
+
             # This would trigger size validation in the UI
             assert Path(tmp.name).stat().st_size > 50 * 1024 * 1024
             
@@ -68,7 +56,7 @@ class TestImprovedFeatures:
         }
         
         # Test JSON serialization
-        json_str = json.dumps(test_data, default=str)
+        json_str = json.dumps(test_data, separators=(',', ':'), default=str)
         parsed_data = json.loads(json_str)
         
         assert parsed_data["app_version"] == "AI Research Assistant v1.0"
@@ -77,19 +65,27 @@ class TestImprovedFeatures:
     def test_memory_optimization(self):
         """Test memory optimization functions."""
         import gc
-        import sys
-        
-        # Create test data
-        test_list = [i for i in range(1000)]
-        initial_objects = len(gc.get_objects())
-        
-        # Clear test data
-        del test_list
-        gc.collect()
-        
-        # Memory should be freed
-        final_objects = len(gc.get_objects())
-        assert final_objects <= initial_objects
+        import tracemalloc
+
+        # Leave tracing on if something else, e.g. -X tracemalloc, started it
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            # Create test data
+            test_list = list(range(1000))
+            initial_memory = tracemalloc.get_traced_memory()[0]
+
+            # Clear test data
+            del test_list
+            gc.collect()
+
+            # Memory should be freed
+            final_memory = tracemalloc.get_traced_memory()[0]
+            assert final_memory <= initial_memory
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
         
     def test_error_handling_structure(self):
         """Test error handling structure."""
@@ -106,17 +102,12 @@ class TestImprovedFeatures:
             assert error_info["error_type"] == "ValueError"
             assert error_info["error_message"] == "Test error"
             
-    def test_config_validation(self):
+    def test_config_validation(self, config):
         """Test configuration validation."""
-        if Config is None:
-            pytest.skip("Config module not available")
-            
-        config = Config()
-        
         # Test that required attributes exist
-        assert hasattr(config, 'model_config')
-        assert hasattr(config, 'processing_config')
-        assert hasattr(config, 'database_config')
+        assert hasattr(config, 'models')
+        assert hasattr(config, 'processing')
+        assert hasattr(config, 'database')
 
 class TestUIComponents:
     """Test UI component functionality."""
@@ -193,11 +184,43 @@ class TestDataManagement:
         }
         
         # Serialize and deserialize
-        json_str = json.dumps(original_data)
+        json_str = json.dumps(original_data, separators=(',', ':'))
         restored_data = json.loads(json_str)
         
         assert restored_data["qa_history"][0]["question"] == original_data["qa_history"][0]["question"]
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_export_round_trip(self, monkeypatch, use_orjson):
+        """Test exports with datetime and numpy values on both JSON backends."""
+        np = pytest.importorskip("numpy")
+        app = pytest.importorskip("app")
+        if use_orjson and app.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(app, "orjson", None)
+
+        exported_at = datetime(2024, 1, 1, 12, 0, 0)
+        export_data = {
+            "qa_history": [
+                {
+                    "question": "Test question",
+                    "answer": {"answer": "Test answer", "confidence": np.float64(0.75)},
+                    "timestamp": exported_at
+                }
+            ],
+            "settings": {"qa_count": np.int64(1), "threshold": np.float32(0.5),
+                         "weights": np.array([0.25, 0.5])},
+            "exported_at": exported_at
+        }
+
+        restored_data = json.loads(app.dumps_export(export_data))
+
+        assert restored_data["qa_history"][0]["question"] == "Test question"
+        assert restored_data["qa_history"][0]["answer"]["confidence"] == 0.75
+        assert restored_data["qa_history"][0]["timestamp"] == str(exported_at)
+        assert restored_data["settings"] == {"qa_count": 1, "threshold": 0.5, "weights": [0.25, 0.5]}
+        assert restored_data["exported_at"] == str(exported_at)
+
 if __name__ == "__main__":
     # Run basic tests
     print("🧪 Running AI Research Assistant Improvement Tests...")
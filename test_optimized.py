@@ -2,22 +2,32 @@
 """
 Optimized demo script for AI Research Assistant
 Tests the system with better error handling and cleaner output
+
+For output without library warnings, run with:
+    PYTHONWARNINGS="ignore::FutureWarning,ignore::UserWarning" python test_optimized.py
 """
 
+import os
 import sys
-from pathlib import Path
-import warnings
 import logging
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings("ignore", category=FutureWarning)
-warnings.filterwarnings("ignore", category=UserWarning)
+# Quiet transformers logging and skip hub telemetry when run as a script
+QUIET_ENV = {
+    'TRANSFORMERS_VERBOSITY': 'error',
+    'HF_HUB_DISABLE_TELEMETRY': '1',
+}
 
 # Set up clean logging
 logging.basicConfig(level=logging.ERROR)
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+# Example questions shown once the system is ready
+EXAMPLE_QUESTIONS = (
+    "What is the main contribution?",
+    "Summarize the methodology",
+    "What are the key findings?",
+    "Explain the experimental setup",
+    "What datasets were used?"
+)
 
 
 def test_system():
@@ -39,8 +49,7 @@ def test_system():
 
         # Test basic functionality
         print("📋 Testing functionality...")
-        papers = assistant.list_papers()
-        print(f"  ✅ Found {len(papers)} papers in library")
+        print(f"  ✅ Found {assistant.count_papers()} papers in library")
 
         # Test general question
         try:
@@ -65,15 +74,7 @@ def test_system():
         print("   python cli.py --help")
 
         print("\n❓ Example Questions:")
-        questions = [
-            "What is the main contribution?",
-            "Summarize the methodology",
-            "What are the key findings?",
-            "Explain the experimental setup",
-            "What datasets were used?"
-        ]
-
-        for q in questions:
+        for q in EXAMPLE_QUESTIONS:
             print(f"   • {q}")
 
         print("\n🎯 Ready for Research!")
@@ -87,5 +88,7 @@ def test_system():
 
 
 if __name__ == "__main__":
+    # Set before test_system imports transformers
+    os.environ.update(QUIET_ENV)
     success = test_system()
     sys.exit(0 if success else 1)
@@ -4,16 +4,22 @@ Robust test for AI Research Assistant with optimized models
 """
 
 import sys
-from pathlib import Path
-import tempfile
 import logging
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
-
 # Set up logging to reduce noise
 logging.basicConfig(level=logging.WARNING)
 
+# Example questions shown in the usage guide
+EXAMPLE_QUESTIONS = (
+    "What is the main contribution of this paper?",
+    "Summarize the methodology section",
+    "What are the key findings?",
+    "Explain the experimental setup",
+    "What datasets were used?",
+    "What are the limitations?",
+    "How does this compare to prior work?"
+)
+
 
 def test_with_reliable_models():
     """Test with reliable, well-supported models"""
@@ -32,6 +38,7 @@ def test_with_reliable_models():
         config.models.scientific_embeddings = "all-MiniLM-L6-v2"  # Reliable general model
         config.models.qa_model = "distilbert-base-cased-distilled-squad"  # Reliable QA model
         config.models.device = "cpu"  # Force CPU to avoid CUDA issues
+        config.models.qa_cpu_dtype = "bfloat16"  # Faster CPU matmuls than FP32
 
         print("  ✅ Configuration ready")
 
@@ -44,8 +51,7 @@ def test_with_reliable_models():
 
         # Test basic functionality
         print("📋 Testing basic functionality...")
-        papers = assistant.list_papers()
-        print(f"  ✅ Paper listing works: {len(papers)} papers found")
+        print(f"  ✅ Paper library works: {assistant.count_papers()} papers found")
 
         # Test question answering (without paper, should handle gracefully)
         print("❓ Testing question answering...")
@@ -57,40 +63,11 @@ def test_with_reliable_models():
         except Exception as e:
             print(f"  ⚠️ QA test (expected limitation): {str(e)[:100]}...")
 
-        # Test paper upload simulation
+        # Test paper processing components (no PDF needed)
         print("📄 Testing paper processing...")
         try:
-            # Create a simple test PDF content
-            test_content = """
-            Research Paper: Artificial Intelligence in Healthcare
-            
-            Abstract: This paper presents a comprehensive survey of AI applications in healthcare.
-            
-            1. Introduction
-            Artificial intelligence has revolutionized many aspects of healthcare delivery.
-            
-            2. Methodology
-            We conducted a systematic review of AI applications in clinical settings.
-            
-            3. Results
-            Our analysis shows significant improvements in diagnostic accuracy.
-            
-            4. Conclusion
-            AI technologies show great promise for improving patient outcomes.
-            """
-
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                f.write(test_content)
-                temp_file = f.name
-
-            # Test if the assistant can handle text processing
-            # (This tests the core functionality without requiring actual PDF)
+            assert assistant.pdf_parser is not None
             print("  ✅ Paper processing components ready")
-
-            # Clean up
-            Path(temp_file).unlink(missing_ok=True)
-
         except Exception as e:
             print(f"  ⚠️ Paper processing test: {str(e)[:100]}...")
 
@@ -127,17 +104,7 @@ def show_usage_guide():
     print("   python cli.py --help")
 
     print("\n❓ EXAMPLE QUESTIONS:")
-    questions = [
-        "What is the main contribution of this paper?",
-        "Summarize the methodology section",
-        "What are the key findings?",
-        "Explain the experimental setup",
-        "What datasets were used?",
-        "What are the limitations?",
-        "How does this compare to prior work?"
-    ]
-
-    for i, q in enumerate(questions, 1):
+    for i, q in enumerate(EXAMPLE_QUESTIONS, 1):
         print(f"   {i}. {q}")
 
     print("\n🔬 Happy researching! ✨")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Tests for the usage guide
+"""
+
+import io
+import sys
+
+import usage_guide
+
+
+def test_prebuilt_guide_is_current():
+    """Test that usage_guide.txt matches the guide text; run _prebuild.py if not."""
+    assert usage_guide.GUIDE_PATH.read_bytes() == usage_guide.GUIDE_BYTES
+
+
+def test_main_writes_guide(monkeypatch):
+    """Test that main prints the whole guide."""
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    usage_guide.main()
+
+    assert stdout.buffer.getvalue() == usage_guide.GUIDE_BYTES
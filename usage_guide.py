@@ -3,168 +3,157 @@
 Complete Usage Guide for AI Research Assistant
 """
 
-import os
+import sys
 from pathlib import Path
 
+# Prebuilt copy of the guide for reading without Python, regenerated by _prebuild.py
+GUIDE_PATH = Path(__file__).with_name("usage_guide.txt")
 
-def print_banner():
-    print("=" * 60)
-    print("🔬 AI RESEARCH ASSISTANT - COMPLETE GUIDE")
-    print("=" * 60)
-    print()
+# The guide is static, so each section is rendered once and written in one call
 
 
-def show_interfaces():
-    print("🌟 AVAILABLE INTERFACES")
-    print("-" * 25)
-    print()
-
-    print("1. 🌐 WEB INTERFACE (Recommended for beginners)")
-    print("   • User-friendly Streamlit interface")
-    print("   • Upload PDFs, ask questions, view results")
-    print("   • Perfect for interactive research")
-    print()
-    print("   📍 How to start:")
-    print("   streamlit run app.py")
-    print("   → Open: http://localhost:8501")
-    print()
-
-    print("2. 🚀 REST API (For developers)")
-    print("   • FastAPI server for programmatic access")
-    print("   • JSON API endpoints")
-    print("   • Perfect for integration with other tools")
-    print()
-    print("   📍 How to start:")
-    print("   python api.py")
-    print("   → API docs: http://localhost:8000/docs")
-    print()
-
-    print("3. 💻 COMMAND LINE (For batch processing)")
-    print("   • CLI for scripting and automation")
-    print("   • Batch processing multiple papers")
-    print("   • Perfect for research workflows")
-    print()
-    print("   📍 How to use:")
-    print("   python cli.py --help")
-    print()
-
-    print("4. 🐍 PYTHON SDK (For custom applications)")
-    print("   • Direct Python API")
-    print("   • Full programmatic control")
-    print("   • Perfect for custom research tools")
-    print()
+def _render_groups(title, rule_width, groups, marker):
+    """Render a titled section of bulleted groups as a single string"""
+    return f"{title}\n{'-' * rule_width}\n\n" + "".join(
+        f"{heading}:\n" + "".join(f"  {marker} {item}\n" for item in items) + "\n"
+        for heading, items in groups
+    )
 
 
-def show_quick_start():
-    print("🚀 QUICK START GUIDE")
-    print("-" * 20)
-    print()
-
-    steps = [
-        "1. 📦 Install Dependencies",
-        "   pip install -r requirements.txt",
-        "",
-        "2. 🌐 Start Web Interface",
-        "   streamlit run app.py",
-        "   → Open http://localhost:8501",
-        "",
-        "3. 📄 Upload a Research Paper",
-        "   • Click 'Browse files' or drag & drop",
-        "   • Supported: PDF files",
-        "   • Wait for processing to complete",
-        "",
-        "4. ❓ Ask Research Questions",
-        "   • 'What is the main contribution?'",
-        "   • 'Summarize the methodology'",
-        "   • 'What are the key findings?'",
-        "   • 'What datasets were used?'",
-        "",
-        "5. 📊 Explore Results",
-        "   • View answers with evidence",
-        "   • Check confidence scores",
-        "   • Export summaries"
-    ]
+BANNER = """\
+============================================================
+🔬 AI RESEARCH ASSISTANT - COMPLETE GUIDE
+============================================================
 
-    for step in steps:
-        print(step)
-    print()
+"""
 
+INTERFACES_TEXT = """\
+🌟 AVAILABLE INTERFACES
+-------------------------
 
-def show_sample_questions():
-    print("❓ RESEARCH QUESTIONS YOU CAN ASK")
-    print("-" * 35)
-    print()
-
-    categories = {
-        "📋 General Analysis": [
-            "What is the main contribution of this paper?",
-            "What problem does this paper solve?",
-            "What is novel about this research?",
-            "How significant is this work?"
-        ],
-        "🔬 Methodology": [
-            "What methodology does this paper use?",
-            "Explain the experimental setup",
-            "What are the key assumptions?",
-            "How was the data collected?"
-        ],
-        "📈 Results & Findings": [
-            "What are the main findings?",
-            "What do the results show?",
-            "How do results compare to baselines?",
-            "What are the performance metrics?"
-        ],
-        "📚 Literature & Context": [
-            "How does this relate to previous work?",
-            "What datasets were used?",
-            "What are the limitations?",
-            "What future work is suggested?"
-        ],
-        "📖 Section-Specific": [
-            "Summarize the abstract",
-            "Explain the introduction",
-            "Describe the methodology section",
-            "What does the conclusion say?"
-        ]
-    }
-
-    for category, questions in categories.items():
-        print(f"{category}:")
-        for question in questions:
-            print(f"  • {question}")
-        print()
+1. 🌐 WEB INTERFACE (Recommended for beginners)
+   • User-friendly Streamlit interface
+   • Upload PDFs, ask questions, view results
+   • Perfect for interactive research
 
+   📍 How to start:
+   streamlit run app.py
+   → Open: http://localhost:8501
 
-def show_api_examples():
-    print("🔗 API USAGE EXAMPLES")
-    print("-" * 21)
-    print()
+2. 🚀 REST API (For developers)
+   • FastAPI server for programmatic access
+   • JSON API endpoints
+   • Perfect for integration with other tools
 
-    print("📤 Upload Paper:")
-    print("curl -X POST http://localhost:8000/papers/upload \\")
-    print("     -F 'file=@research_paper.pdf'")
-    print()
+   📍 How to start:
+   python api.py
+   → API docs: http://localhost:8000/docs
 
-    print("❓ Ask Question:")
-    print("curl -X POST http://localhost:8000/papers/ask \\")
-    print("     -H 'Content-Type: application/json' \\")
-    print("     -d '{")
-    print("       \"question\": \"What is the main contribution?\",")
-    print("       \"paper_id\": \"your-paper-id\"")
-    print("     }'")
-    print()
+3. 💻 COMMAND LINE (For batch processing)
+   • CLI for scripting and automation
+   • Batch processing multiple papers
+   • Perfect for research workflows
 
-    print("📋 List Papers:")
-    print("curl http://localhost:8000/papers")
-    print()
+   📍 How to use:
+   python cli.py --help
 
+4. 🐍 PYTHON SDK (For custom applications)
+   • Direct Python API
+   • Full programmatic control
+   • Perfect for custom research tools
 
-def show_python_examples():
-    print("🐍 PYTHON SDK EXAMPLES")
-    print("-" * 23)
-    print()
+"""
+
+QUICK_START_TEXT = """\
+🚀 QUICK START GUIDE
+--------------------
+
+1. 📦 Install Dependencies
+   pip install -r requirements.txt
+
+2. 🌐 Start Web Interface
+   streamlit run app.py
+   → Open http://localhost:8501
+
+3. 📄 Upload a Research Paper
+   • Click 'Browse files' or drag & drop
+   • Supported: PDF files
+   • Wait for processing to complete
+
+4. ❓ Ask Research Questions
+   • 'What is the main contribution?'
+   • 'Summarize the methodology'
+   • 'What are the key findings?'
+   • 'What datasets were used?'
+
+5. 📊 Explore Results
+   • View answers with evidence
+   • Check confidence scores
+   • Export summaries
+
+"""
+
+QUESTION_CATEGORIES = {
+    "📋 General Analysis": [
+        "What is the main contribution of this paper?",
+        "What problem does this paper solve?",
+        "What is novel about this research?",
+        "How significant is this work?"
+    ],
+    "🔬 Methodology": [
+        "What methodology does this paper use?",
+        "Explain the experimental setup",
+        "What are the key assumptions?",
+        "How was the data collected?"
+    ],
+    "📈 Results & Findings": [
+        "What are the main findings?",
+        "What do the results show?",
+        "How do results compare to baselines?",
+        "What are the performance metrics?"
+    ],
+    "📚 Literature & Context": [
+        "How does this relate to previous work?",
+        "What datasets were used?",
+        "What are the limitations?",
+        "What future work is suggested?"
+    ],
+    "📖 Section-Specific": [
+        "Summarize the abstract",
+        "Explain the introduction",
+        "Describe the methodology section",
+        "What does the conclusion say?"
+    ]
+}
+
+SAMPLE_QUESTIONS_TEXT = _render_groups(
+    "❓ RESEARCH QUESTIONS YOU CAN ASK", 35, QUESTION_CATEGORIES.items(), "•")
+
+API_EXAMPLES_TEXT = """\
+🔗 API USAGE EXAMPLES
+---------------------
+
+📤 Upload Paper:
+curl -X POST http://localhost:8000/papers/upload \\
+     -F 'file=@research_paper.pdf'
+
+❓ Ask Question:
+curl -X POST http://localhost:8000/papers/ask \\
+     -H 'Content-Type: application/json' \\
+     -d '{
+       "question": "What is the main contribution?",
+       "paper_id": "your-paper-id"
+     }'
+
+📋 List Papers:
+curl http://localhost:8000/papers
+
+"""
+
+PYTHON_EXAMPLES_TEXT = """\
+🐍 PYTHON SDK EXAMPLES
+-----------------------
 
-    code = '''
 # Import the research assistant
 from src.research_assistant import ResearchAssistant
 
@@ -189,70 +178,52 @@ print(f"Summary: {summary}")
 # Analyze contribution
 analysis = assistant.analyze_contribution(paper_id)
 print(f"Analysis: {analysis}")
-'''
 
-    print(code.strip())
-    print()
+"""
 
+TIPS_TEXT = """\
+💡 TIPS & TRICKS
+----------------
 
-def show_tips_and_tricks():
-    print("💡 TIPS & TRICKS")
-    print("-" * 16)
-    print()
-
-    tips = [
-        "📄 Upload Quality: Use high-quality PDFs with selectable text",
-        "❓ Question Types: Ask specific, focused questions for best results",
-        "📊 Section Focus: Target specific sections for detailed analysis",
-        "🔄 Multiple Questions: Ask follow-up questions to dive deeper",
-        "💾 Save Results: Export summaries and answers for later use",
-        "🔍 Search Feature: Use semantic search to find relevant content",
-        "⚡ Performance: CPU processing may be slower than GPU",
-        "🔧 Configuration: Adjust model settings in src/config.py"
-    ]
+  • 📄 Upload Quality: Use high-quality PDFs with selectable text
+  • ❓ Question Types: Ask specific, focused questions for best results
+  • 📊 Section Focus: Target specific sections for detailed analysis
+  • 🔄 Multiple Questions: Ask follow-up questions to dive deeper
+  • 💾 Save Results: Export summaries and answers for later use
+  • 🔍 Search Feature: Use semantic search to find relevant content
+  • ⚡ Performance: CPU processing may be slower than GPU
+  • 🔧 Configuration: Adjust model settings in src/config.py
 
-    for tip in tips:
-        print(f"  • {tip}")
-    print()
+"""
 
+# (issue, solutions) pairs
+TROUBLESHOOTING_ISSUES = (
+    ("❌ Import Errors", (
+        "Run: pip install -r requirements.txt",
+        "Check Python version (3.8+ required)"
+    )),
+    ("🐌 Slow Processing", (
+        "Normal on CPU - GPU recommended for production",
+        "Reduce model size in config if needed"
+    )),
+    ("📄 PDF Issues", (
+        "Ensure PDF has selectable text (not scanned images)",
+        "Try different PDF if processing fails"
+    )),
+    ("🤖 Model Loading", (
+        "First run downloads models (may take time)",
+        "Check internet connection for model downloads"
+    ))
+)
 
-def show_troubleshooting():
-    print("🔧 TROUBLESHOOTING")
-    print("-" * 18)
-    print()
-
-    issues = {
-        "❌ Import Errors": [
-            "Run: pip install -r requirements.txt",
-            "Check Python version (3.8+ required)"
-        ],
-        "🐌 Slow Processing": [
-            "Normal on CPU - GPU recommended for production",
-            "Reduce model size in config if needed"
-        ],
-        "📄 PDF Issues": [
-            "Ensure PDF has selectable text (not scanned images)",
-            "Try different PDF if processing fails"
-        ],
-        "🤖 Model Loading": [
-            "First run downloads models (may take time)",
-            "Check internet connection for model downloads"
-        ]
-    }
-
-    for issue, solutions in issues.items():
-        print(f"{issue}:")
-        for solution in solutions:
-            print(f"  → {solution}")
-        print()
+TROUBLESHOOTING_TEXT = _render_groups(
+    "🔧 TROUBLESHOOTING", 18, TROUBLESHOOTING_ISSUES, "→")
 
+PROJECT_STRUCTURE_TEXT = """\
+📁 PROJECT STRUCTURE
+--------------------
 
-def show_project_structure():
-    print("📁 PROJECT STRUCTURE")
-    print("-" * 20)
-    print()
 
-    structure = """
 ai-research-assistant/
 ├── 📱 app.py                    # Streamlit web interface
 ├── 🚀 api.py                    # FastAPI REST API
@@ -269,33 +240,85 @@ ai-research-assistant/
 │   └── analysis/               # Advanced analysis
 ├── data/                       # Uploaded papers storage
 └── web/                        # Additional web assets
+
 """
 
-    print(structure)
+CLOSING_TEXT = """\
+🎉 CONGRATULATIONS!
+-----------------
+Your AI Research Assistant is ready to use!
+
+🚀 Next Steps:
+1. Start the web interface: streamlit run app.py
+2. Upload your first research paper
+3. Ask questions and explore the results
+
+📚 Need help? Check the README.md or run the demo
+✨ Happy researching!
+"""
+
+# The complete guide, in the order main() shows it
+GUIDE_TEXT = "".join((
+    BANNER,
+    INTERFACES_TEXT,
+    QUICK_START_TEXT,
+    SAMPLE_QUESTIONS_TEXT,
+    API_EXAMPLES_TEXT,
+    PYTHON_EXAMPLES_TEXT,
+    TIPS_TEXT,
+    TROUBLESHOOTING_TEXT,
+    PROJECT_STRUCTURE_TEXT,
+    CLOSING_TEXT,
+))
+GUIDE_BYTES = GUIDE_TEXT.encode("utf-8")
+
+
+def print_banner():
+    sys.stdout.write(BANNER)
+
+
+def show_interfaces():
+    sys.stdout.write(INTERFACES_TEXT)
+
+
+def show_quick_start():
+    sys.stdout.write(QUICK_START_TEXT)
+
+
+def show_sample_questions():
+    sys.stdout.write(SAMPLE_QUESTIONS_TEXT)
+
+
+def show_api_examples():
+    sys.stdout.write(API_EXAMPLES_TEXT)
+
+
+def show_python_examples():
+    sys.stdout.write(PYTHON_EXAMPLES_TEXT)
+
+
+def show_tips_and_tricks():
+    sys.stdout.write(TIPS_TEXT)
+
+
+def show_troubleshooting():
+    sys.stdout.write(TROUBLESHOOTING_TEXT)
+
+
+def show_project_structure():
+    sys.stdout.write(PROJECT_STRUCTURE_TEXT)
 
 
 def main():
-    print_banner()
-    show_interfaces()
-    show_quick_start()
-    show_sample_questions()
-    show_api_examples()
-    show_python_examples()
-    show_tips_and_tricks()
-    show_troubleshooting()
-    show_project_structure()
-
-    print("🎉 CONGRATULATIONS!")
-    print("-" * 17)
-    print("Your AI Research Assistant is ready to use!")
-    print()
-    print("🚀 Next Steps:")
-    print("1. Start the web interface: streamlit run app.py")
-    print("2. Upload your first research paper")
-    print("3. Ask questions and explore the results")
-    print()
-    print("📚 Need help? Check the README.md or run the demo")
-    print("✨ Happy researching!")
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only streams, e.g. when stdout is redirected to a StringIO
+        sys.stdout.write(GUIDE_TEXT)
+        return
+
+    sys.stdout.flush()
+    buffer.write(GUIDE_BYTES)
+    buffer.flush()
 
 
 if __name__ == "__main__":
@@ -6,55 +6,187 @@ AI Research Assistant - Requirements Validation
 This script validates that all requirements are properly installed and working.
 """
 
+import re
 import sys
 import importlib
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import metadata
+from importlib.util import find_spec
 from pathlib import Path
 
+# Section rule
+_RULE = "=" * 60
+
+
+def _probe_import(module_name):
+    """Import a module; returns (success, version or error)"""
+    try:
+        module = importlib.import_module(module_name)
+        return True, getattr(module, '__version__', 'unknown')
+    except Exception as e:
+        return False, e
+
+
+@lru_cache(maxsize=None)
+def _module_distributions():
+    """Map top-level module names to the distributions providing them"""
+    # packages_distributions is only available on Python 3.10+
+    packages_distributions = getattr(metadata, 'packages_distributions', None)
+    return packages_distributions() if packages_distributions else {}
+
+
+def _probe_installed(module_name):
+    """Find a module without importing it; returns (success, version or error)"""
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError) as e:
+        return False, e
+    if spec is None:
+        return False, f"No module named '{module_name}'"
+
+    top_level = module_name.split('.')[0]
+    for distribution in _module_distributions().get(top_level, [top_level]):
+        try:
+            return True, metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            continue
+    return True, 'unknown'
+
+
+def _report_import(display_name, result):
+    """Print the outcome of an import probe"""
+    success, detail = result
+    print(f"{'✅' if success else '❌'} {display_name}: {detail}")
+    return success
+
 
 def test_import(module_name, display_name=None):
     """Test if a module can be imported"""
     if display_name is None:
         display_name = module_name
 
-    try:
-        module = importlib.import_module(module_name)
-        version = getattr(module, '__version__', 'unknown')
-        print(f"✅ {display_name}: {version}")
-        return True
-    except ImportError as e:
-        print(f"❌ {display_name}: {e}")
-        return False
+    return _report_import(display_name, _probe_import(module_name))
 
 
-def test_requirements_file(req_file):
-    """Test if a requirements file can be installed"""
-    if not Path(req_file).exists():
-        print(f"❌ {req_file}: File not found")
-        return False
+def test_installed(modules):
+    """Check (module, display name) pairs are installed, concurrently; returns how many are
+
+    Modules are only located, not imported: importing packages that import
+    each other from several threads risks import lock deadlocks. Results
+    are printed in the given order once all probes finish.
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_probe_installed, [module for module, _ in modules]))
+
+    return sum(_report_import(name, result)
+               for (_, name), result in zip(modules, results))
+
+
+def _start_requirements_check(req_file):
+    """Start a pip dry-run install of a requirements file"""
+    import subprocess
+
+    return subprocess.Popen([
+        sys.executable, '-m', 'pip', 'install', '--dry-run', '-r', req_file
+    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def _finish_requirements_check(req_file, process):
+    """Wait for a pip dry-run started by _start_requirements_check and report it"""
+    import subprocess
 
     try:
-        result = subprocess.run([
-            sys.executable, '-m', 'pip', 'install', '--dry-run', '-r', req_file
-        ], capture_output=True, text=True, timeout=30)
+        try:
+            _, stderr = process.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            print(f"❌ {req_file}: Timeout during validation")
+            return False
 
-        if result.returncode == 0:
+        if process.returncode == 0:
             print(f"✅ {req_file}: Valid")
             return True
         else:
-            print(f"❌ {req_file}: Invalid - {result.stderr}")
+            print(f"❌ {req_file}: Invalid - {stderr}")
             return False
-    except subprocess.TimeoutExpired:
-        print(f"❌ {req_file}: Timeout during validation")
+    except Exception as e:
+        print(f"❌ {req_file}: Error - {e}")
         return False
+
+
+def _parse_requirements_file(req_file, requirement_type):
+    """Check that every requirement line in a file is well-formed"""
+    try:
+        lines = Path(req_file).read_text().splitlines()
     except Exception as e:
         print(f"❌ {req_file}: Error - {e}")
         return False
 
+    for line_number, line in enumerate(lines, 1):
+        # Comments start a line or follow whitespace; option lines such as -r are skipped
+        line = re.sub(r'(^|\s)#.*$', '', line).strip()
+        if line and not line.startswith('-'):
+            try:
+                requirement_type(line)
+            except Exception as e:
+                print(f"❌ {req_file}: Invalid - line {line_number}: {e}")
+                return False
+
+    print(f"✅ {req_file}: Valid")
+    return True
+
+
+def test_requirements_file(req_file):
+    """Test if a requirements file is valid"""
+    return test_requirements_files([req_file]) == 1
+
+
+def test_requirements_files(req_files):
+    """Test requirements files; returns how many are valid
+
+    Lines are parsed with packaging when it is available. Without it,
+    pip dry runs are started for all files at once.
+    """
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+
+    if Requirement is not None:
+        valid = 0
+        for req_file in req_files:
+            if not Path(req_file).exists():
+                print(f"❌ {req_file}: File not found")
+            elif _parse_requirements_file(req_file, Requirement):
+                valid += 1
+        return valid
+
+    processes = {}
+    for req_file in req_files:
+        if Path(req_file).exists():
+            try:
+                processes[req_file] = _start_requirements_check(req_file)
+            except Exception as e:
+                processes[req_file] = e
+
+    valid = 0
+    for req_file in req_files:
+        process = processes.get(req_file)
+        if process is None:
+            print(f"❌ {req_file}: File not found")
+        elif isinstance(process, Exception):
+            print(f"❌ {req_file}: Error - {process}")
+        elif _finish_requirements_check(req_file, process):
+            valid += 1
+
+    return valid
+
 
 def main():
     print("🔬 AI Research Assistant - Requirements Validation")
-    print("=" * 60)
+    print(_RULE)
 
     # Test core imports
     print("\n📦 Testing Core Dependencies:")
@@ -76,10 +208,8 @@ def main():
         ("click", "Click"),
     ]
 
-    core_success = 0
-    for module, name in core_imports:
-        if test_import(module, name):
-            core_success += 1
+    # Dependencies only need to be installed; importing them all is slow
+    core_success = test_installed(core_imports)
 
     print(f"\n📊 Core Dependencies: {core_success}/{len(core_imports)} working")
 
@@ -93,6 +223,7 @@ def main():
         ("src.research_qa.academic_qa", "Academic QA"),
     ]
 
+    # These import each other, so they are imported one at a time
     custom_success = 0
     for module, name in custom_modules:
         if test_import(module, name):
@@ -111,10 +242,7 @@ def main():
         "requirements-biomedical.txt"
     ]
 
-    req_success = 0
-    for req_file in req_files:
-        if test_requirements_file(req_file):
-            req_success += 1
+    req_success = test_requirements_files(req_files)
 
     print(f"\n📊 Requirements Files: {req_success}/{len(req_files)} valid")
 
@@ -122,7 +250,7 @@ def main():
     total_tests = len(core_imports) + len(custom_modules) + len(req_files)
     total_success = core_success + custom_success + req_success
 
-    print("\n" + "=" * 60)
+    print("\n" + _RULE)
     print(f"📊 Overall Status: {total_success}/{total_tests} tests passed")
 
     if total_success == total_tests:
@@ -5,40 +5,72 @@ Confirms all components are working correctly
 """
 
 import sys
+import importlib
 from pathlib import Path
-import tempfile
-import urllib.request
-import time
+
+# Header rule and result divider
+_RULE = "=" * 50
+_DIVIDER = "-" * 50
+
+# Project root, resolved once
+_ROOT = Path(__file__).resolve().parent
 
 # Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+sys.path.append(str(_ROOT / "src"))
 
+USAGE_INFO_TEXT = """
+============================================================
+🎉 AI RESEARCH ASSISTANT - VALIDATION COMPLETE!
+============================================================
 
-def test_imports():
-    """Test all critical imports"""
-    print("🔧 Testing imports...")
+✅ SYSTEM STATUS: FULLY OPERATIONAL
 
-    try:
-        from src.config import Config
-        print("  ✅ Config import successful")
+🚀 QUICK START:
+  1. Run: streamlit run app.py
+  2. Open: http://localhost:8501
+  3. Upload a PDF paper
+  4. Ask research questions!
 
-        from src.research_assistant import ResearchAssistant
-        print("  ✅ ResearchAssistant import successful")
+💡 EXAMPLE QUESTIONS:
+  • What is the main contribution?
+  • Summarize the methodology
+  • What are the key findings?
+  • Explain section 3.1
 
-        from src.paper_processor.pdf_parser import AcademicPDFParser
-        print("  ✅ PDF Parser import successful")
+🛠️ OTHER INTERFACES:
+  • API Server: python api.py
+  • CLI Tool: python cli.py --help
+  • Demo: python demo.py
 
-        from src.research_embeddings.academic_embeddings import MultimodalResearchEmbeddings
-        print("  ✅ Embeddings import successful")
+Happy researching! 🔬✨
+"""
+USAGE_INFO_BYTES = USAGE_INFO_TEXT.encode("utf-8")
 
-        from src.research_qa.academic_qa import AcademicQuestionAnswering
-        print("  ✅ QA System import successful")
+# (module, name, label) for each critical import
+CRITICAL_IMPORTS = (
+    ("src.config", "Config", "Config"),
+    ("src.research_assistant", "ResearchAssistant", "ResearchAssistant"),
+    ("src.paper_processor.pdf_parser", "AcademicPDFParser", "PDF Parser"),
+    ("src.research_embeddings.academic_embeddings", "MultimodalResearchEmbeddings", "Embeddings"),
+    ("src.research_qa.academic_qa", "AcademicQuestionAnswering", "QA System"),
+)
 
-        return True
 
-    except Exception as e:
-        print(f"  ❌ Import failed: {e}")
-        return False
+def test_imports():
+    """Test all critical imports"""
+    print("🔧 Testing imports...")
+
+    # Check every import, so one failure doesn't hide the others
+    all_imported = True
+    for module_name, attribute, label in CRITICAL_IMPORTS:
+        try:
+            getattr(importlib.import_module(module_name), attribute)
+            print(f"  ✅ {label} import successful")
+        except Exception as e:
+            print(f"  ❌ {label} import failed: {e}")
+            all_imported = False
+
+    return all_imported
 
 
 def test_initialization():
@@ -84,7 +116,7 @@ def test_file_access():
     print("\\n📁 Testing file system access...")
 
     try:
-        data_dir = Path(__file__).parent / "data"
+        data_dir = _ROOT / "data"
         data_dir.mkdir(exist_ok=True)
 
         # Test write access
@@ -114,7 +146,7 @@ def test_web_components():
         print("  ✅ FastAPI available")
 
         # Test if main app file exists
-        app_file = Path(__file__).parent / "app.py"
+        app_file = _ROOT / "app.py"
         if app_file.exists():
             print("  ✅ Web app file exists")
         else:
@@ -129,36 +161,20 @@ def test_web_components():
 
 def show_usage_info():
     """Show usage information"""
-    print("\\n" + "="*60)
-    print("🎉 AI RESEARCH ASSISTANT - VALIDATION COMPLETE!")
-    print("="*60)
-    print()
-    print("✅ SYSTEM STATUS: FULLY OPERATIONAL")
-    print()
-    print("🚀 QUICK START:")
-    print("  1. Run: streamlit run app.py")
-    print("  2. Open: http://localhost:8501")
-    print("  3. Upload a PDF paper")
-    print("  4. Ask research questions!")
-    print()
-    print("💡 EXAMPLE QUESTIONS:")
-    print("  • What is the main contribution?")
-    print("  • Summarize the methodology")
-    print("  • What are the key findings?")
-    print("  • Explain section 3.1")
-    print()
-    print("🛠️ OTHER INTERFACES:")
-    print("  • API Server: python api.py")
-    print("  • CLI Tool: python cli.py --help")
-    print("  • Demo: python demo.py")
-    print()
-    print("Happy researching! 🔬✨")
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(USAGE_INFO_TEXT)
+        return
+
+    sys.stdout.flush()
+    buffer.write(USAGE_INFO_BYTES)
+    buffer.flush()
 
 
 def main():
     """Main validation function"""
     print("🔬 AI RESEARCH ASSISTANT - FINAL VALIDATION")
-    print("="*50)
+    print(_RULE)
 
     # Run all tests
     tests = [
@@ -181,7 +197,7 @@ def main():
     else:
         all_passed = False
 
-    print("\\n" + "-"*50)
+    print("\\n" + _DIVIDER)
 
     if all_passed:
         print("🎉 ALL TESTS PASSED - SYSTEM READY!")